@@ -1,4 +1,5 @@
-import requests
+import httpx
+import orjson
 from fastapi import HTTPException
 
 from authorizations.src.settings import todoist_auth_settings
@@ -15,7 +16,9 @@ def authorize():
     return authorization_url
 
 
-def callback(code: str = None, state: str = None, error: str = None):
+async def callback(
+    client: httpx.AsyncClient, code: str = None, state: str = None, error: str = None
+):
     if state != todoist_auth_settings.todoist_state:
         raise HTTPException(status_code=400, detail="State parameter mismatch")
 
@@ -26,27 +29,35 @@ def callback(code: str = None, state: str = None, error: str = None):
         "redirect_uri": todoist_auth_settings.todoist_redirect_url,
     }
     try:
-        response = requests.post(
+        response = await client.post(
             todoist_auth_settings.todoist_token_exchange_api_url, data=token_params
         )
-        response.raise_for_status()
-        response_data = response.json()
-
-        return response_data["access_token"]
-    except requests.HTTPError:
-        error_data = response.json()
-        # This could happen if the code is used more than once, or if it has expired.
-        if error_data.get("error") == "bad_authorization_code":
-            raise HTTPException(status_code=400, detail="Bad authorization code")
-        # client_id or client_secret parameters are incorrect:
-        elif error_data.get("error") == "incorrect_application_credentials":
-            raise HTTPException(
-                status_code=401, detail="Incorrect application credentials"
-            )
-        else:
-            raise HTTPException(status_code=500, detail="Token exchange failed")
-    except requests.RequestException as req_err:
+    except httpx.RequestError as req_err:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to communicate with Todoist: {str(req_err)}",
         )
+
+    # The body may not be JSON, e.g. an HTML 502 page or an empty reply from a proxy
+    try:
+        response_data = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=500, detail="Token exchange failed")
+    if not isinstance(response_data, dict):
+        raise HTTPException(status_code=500, detail="Token exchange failed")
+
+    if response.status_code < 400:
+        if "access_token" not in response_data:
+            raise HTTPException(status_code=500, detail="Token exchange failed")
+        return response_data["access_token"]
+
+    # This could happen if the code is used more than once, or if it has expired.
+    if response_data.get("error") == "bad_authorization_code":
+        raise HTTPException(status_code=400, detail="Bad authorization code")
+    # client_id or client_secret parameters are incorrect:
+    elif response_data.get("error") == "incorrect_application_credentials":
+        raise HTTPException(
+            status_code=401, detail="Incorrect application credentials"
+        )
+    else:
+        raise HTTPException(status_code=500, detail="Token exchange failed")
@@ -1,77 +1,271 @@
-import json
-import requests
+import asyncio
+import logging
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+import httpx
+import orjson
 from fastapi import HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+from authorizations.src.rate_limiter import TokenBucket
 from authorizations.src.settings import base_hackathon_settings
 
-# Глобальный словарь для хранения токенов локально
-authorization_data = {}
+logger = logging.getLogger("auth")
 
-def save_authorization_data_and_return_response(
-    authorization_data_response, system_name: str
-) -> JSONResponse:
-    global authorization_data  # Явное указание, что authorization_data — это глобальная переменная
+# Имена систем передаются в каждое сохранение авторизации, поэтому интернируются один раз
+GITHUB_SYSTEM_NAME = sys.intern("GitHub")
+TODOIST_SYSTEM_NAME = sys.intern("Todoist")
 
-    header = {
-        "Authorization": f"Bearer {base_hackathon_settings.user_token_from_tg_bot}"
-    }
+# Параметры окна накопления запросов на сохранение авторизаций
+MAX_BATCH = 32
+MAX_WAIT = 0.03
+
+# Заголовок авторизации на сервере хакатона не меняется во время работы сервиса
+_AUTH_HEADER = {"Authorization": f"Bearer {base_hackathon_settings.user_token_from_tg_bot}"}
+
+# Число попыток фонового сохранения авторизации на сервере хакатона
+SAVE_ATTEMPTS = 3
+
+# Тело успешного ответа не меняется, поэтому сериализуется один раз
+_OK_BODY = orjson.dumps({"message": "Authorization successful and data saved."})
+
+# Ответы для ошибок сервера хакатона при сохранении авторизации
+_STATUS_MAP: dict[int, tuple[int, str]] = {
+    400: (400, "Bad request to save authorization data"),
+    401: (401, "Unauthorized to save authorization data"),
+    403: (403, "Forbidden to save authorization data"),
+    404: (404, "Endpoint to save authorization data not found"),
+}
+
+
+class TTLCache:
+    """
+    Ограниченный LRU-кэш с временем жизни для каждой записи.
+    Используется только из обработчиков event loop, поэтому блокировки не нужны.
+    Порядок вытеснения обновляется при записи значения.
+    """
+
+    def __init__(self, maxsize: int = 1000, default_ttl: float = 3600):
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() > entry["expires_at"]:
+            del self._entries[key]
+            return None
+        return entry["value"]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        now = time.monotonic()
+        self._entries[key] = {
+            "value": value,
+            "expires_at": now + (ttl or self.default_ttl),
+            "created_at": now,
+        }
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+# Ограничение частоты повторных сохранений на сервере хакатона
+save_bucket = TokenBucket(rate=20, capacity=40)
+
+# Ссылки на фоновые задачи сохранения, чтобы их не собрал сборщик мусора
+_background_tasks: set[asyncio.Task] = set()
+
+
+def json_response(body: bytes, status_code: int = 200) -> Response:
+    """Возвращает ответ с заранее сериализованным JSON-телом."""
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Создаёт общий HTTP/2-клиент: параллельные обмены токенами и сохранения авторизаций
+    мультиплексируются поверх одного соединения с каждым хостом.
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(max_connections=128, max_keepalive_connections=32),
+    )
+    return httpx.AsyncClient(transport=transport, timeout=httpx.Timeout(5.0, connect=2.0))
+
+
+class SaveAuthorizationBatcher:
+    """
+    Накапливает запросы на сохранение авторизаций в течение короткого окна
+    и отправляет их на сервер хакатона одним пакетным запросом.
+    Если пакетный эндпоинт не задан или не поддерживается, запросы отправляются по одному параллельно.
+    """
+
+    def __init__(
+        self, client: httpx.AsyncClient, max_batch: int = MAX_BATCH, max_wait: float = MAX_WAIT
+    ):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._client = client
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._batch_supported = bool(base_hackathon_settings.save_auth_data_batch_endpoint)
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
 
+    async def submit(self, data: dict) -> httpx.Response:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((data, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._flush(batch)
+            except Exception as e:
+                # Любая ошибка отправки (неверный URL, несериализуемые данные) достаётся ожидающим
+                # этого пакета, а фоновая задача продолжает обслуживать следующие запросы
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    async def _flush(self, batch: list) -> None:
+        if self._batch_supported and len(batch) > 1:
+            try:
+                resp = await self._client.post(
+                    base_hackathon_settings.save_auth_data_batch_endpoint,
+                    json={"items": [data for data, _ in batch]},
+                    headers=_AUTH_HEADER,
+                )
+            except httpx.RequestError as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+            if resp.status_code not in (404, 405):
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(resp)
+                return
+            # Сервер не поддерживает пакетное сохранение, переходим на поштучную отправку
+            self._batch_supported = False
+
+        results = await asyncio.gather(
+            *(
+                self._client.post(
+                    base_hackathon_settings.save_auth_data_endpoint, json=data, headers=_AUTH_HEADER
+                )
+                for data, _ in batch
+            ),
+            return_exceptions=True,
+        )
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+def _build_save_payload(authorization_data_response, system_name: str) -> dict:
     # Данные для отправки на внешний сервер
-    data = {
+    return {
         "system_name": system_name,
-        "authorization_data_json": json.dumps(authorization_data_response),
+        "authorization_data_json": orjson.dumps(authorization_data_response).decode(),
     }
 
+
+def schedule_authorization_save(
+    batcher: SaveAuthorizationBatcher, authorization_data_response, system_name: str
+) -> None:
+    """Сохраняет данные авторизации на сервере хакатона в фоне, не задерживая ответ пользователю."""
+    task = asyncio.create_task(
+        _save_with_retries(batcher, _build_save_payload(authorization_data_response, system_name))
+    )
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def _save_with_retries(batcher: SaveAuthorizationBatcher, data: dict) -> None:
+    for attempt in range(1, SAVE_ATTEMPTS + 1):
+        await save_bucket.acquire()
+        try:
+            resp = await batcher.submit(data)
+        except httpx.RequestError as e:
+            logger.warning("Attempt %s to save %s authorization failed: %s", attempt, data["system_name"], e)
+            continue
+
+        save_bucket.update_from_response(resp)
+        if resp.is_success:
+            return
+        # Повторяем только при перегрузке или ошибках сервера
+        if resp.status_code != 429 and resp.status_code < 500:
+            break
+        logger.warning(
+            "Attempt %s to save %s authorization failed with status %s",
+            attempt, data["system_name"], resp.status_code,
+        )
+
+    logger.error("Could not save %s authorization data", data["system_name"])
+
+
+async def save_authorization_data_and_return_response(
+    batcher: SaveAuthorizationBatcher, authorization_data_response, system_name: str
+) -> Response:
+    data = _build_save_payload(authorization_data_response, system_name)
+
     try:
         # Отправка данных авторизации на внешний сервер
-        resp = requests.post(
-            base_hackathon_settings.save_auth_data_endpoint, json=data, headers=header
+        resp = await batcher.submit(data)
+    except httpx.RequestError:
+        raise HTTPException(
+            status_code=500, detail="Error occurred while saving authorization data"
         )
-        resp.raise_for_status()
 
-        # Локальное сохранение токена для доступа в дальнейшем
-        if 'access_token' in authorization_data_response:
-            authorization_data[system_name] = {"access_token": authorization_data_response['access_token']}
-        else:
-            raise ValueError("No access token found in authorization_data_response")
-
-        # Проверка успешного сохранения
-        if resp.status_code == 200:
-            return JSONResponse(
-                status_code=200,
-                content={"message": "Authorization successful and data saved."},
-            )
-        else:
-            return JSONResponse(
-                status_code=resp.status_code,
-                content={"message": f"Unexpected response: {resp.status_code}"},
-            )
-
-    except requests.exceptions.HTTPError as e:
-        if resp.status_code == 400:
-            raise HTTPException(
-                status_code=400, detail="Bad request to save authorization data"
-            )
-        elif resp.status_code == 401:
-            raise HTTPException(
-                status_code=401, detail="Unauthorized to save authorization data"
-            )
-        elif resp.status_code == 403:
-            raise HTTPException(
-                status_code=403, detail="Forbidden to save authorization data"
-            )
-        elif resp.status_code == 404:
-            raise HTTPException(
-                status_code=404, detail="Endpoint to save authorization data not found"
-            )
+    if not resp.is_success:
+        if resp.status_code in _STATUS_MAP:
+            status_code, detail = _STATUS_MAP[resp.status_code]
         elif resp.status_code >= 500:
-            raise HTTPException(
-                status_code=502, detail="Server error while saving authorization data"
-            )
+            status_code, detail = 502, "Server error while saving authorization data"
         else:
-            raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
+            status_code, detail = 500, f"Unexpected error: status {resp.status_code}"
+        raise HTTPException(status_code=status_code, detail=detail)
 
-    except requests.exceptions.RequestException:
-        raise HTTPException(
-            status_code=500, detail="Error occurred while saving authorization data"
+    # Токен хранится на сервере хакатона, откуда его получают действия
+    if 'access_token' not in authorization_data_response:
+        raise ValueError("No access token found in authorization_data_response")
+
+    # Проверка успешного сохранения
+    if resp.status_code == 200:
+        return json_response(_OK_BODY)
+    else:
+        return ORJSONResponse(
+            status_code=resp.status_code,
+            content={"message": f"Unexpected response: {resp.status_code}"},
         )
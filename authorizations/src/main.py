@@ -1,18 +1,32 @@
-from fastapi import FastAPI, HTTPException
-import requests
+import asyncio
+import logging
+from urllib.parse import urlencode
+
+import orjson
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 
 from authorizations.src.authorization_services import todoist
 from authorizations.src.hackathon_utils import (
+    GITHUB_SYSTEM_NAME,
+    TODOIST_SYSTEM_NAME,
+    SaveAuthorizationBatcher,
+    TTLCache,
+    create_http_client,
+    json_response,
     save_authorization_data_and_return_response,
+    schedule_authorization_save,
 )
+from authorizations.src.rate_limiter import TokenBucket
 from authorizations.src.settings import (
     base_hackathon_settings,
     todoist_auth_settings,
     github_auth_settings
 )
-from team_actions.src.actions.GitHub.actions import authorization_data
 
-app = FastAPI()
+logger = logging.getLogger("auth")
+
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Проверка настроек Telegram
 assert (
@@ -35,6 +49,43 @@ assert (
     github_auth_settings.github_client_secret != ""
 ), "Укажите GitHub Client Secret в settings.py"
 
+
+# URL авторизации GitHub зависит только от настроек, поэтому собирается один раз
+_GITHUB_AUTH_PARAMS = urlencode(
+    {
+        "client_id": github_auth_settings.github_client_id,
+        "redirect_uri": github_auth_settings.github_redirect_url,
+    }
+)
+GITHUB_AUTH_URL = f"https://github.com/login/oauth/authorize?{_GITHUB_AUTH_PARAMS}"
+
+# Ответ на успешную авторизацию GitHub не меняется, поэтому сериализуется один раз
+_GITHUB_OK_BODY = orjson.dumps({"message": "Authorization successful"})
+
+# Повторный колбэк с тем же кодом (двойной клик, повтор браузера) не обменивает код повторно:
+# коды GitHub одноразовые, и второй обмен завершился бы ошибкой
+_code_cache = TTLCache(maxsize=256, default_ttl=60)
+# Обмены кодов, которые ещё выполняются: повторный запрос с тем же кодом ждёт их результата
+_code_inflight: dict[str, asyncio.Future] = {}
+
+# Ограничение частоты обмена кодов на токены, чтобы не упираться в лимиты GitHub
+github_token_bucket = TokenBucket(rate=10, capacity=20)
+
+
+# Общий асинхронный HTTP-клиент для исходящих запросов к OAuth-провайдерам и серверу хакатона
+@app.on_event("startup")
+async def open_http_client():
+    app.state.http = create_http_client()
+    app.state.save_batcher = SaveAuthorizationBatcher(app.state.http)
+    app.state.save_batcher.start()
+
+
+@app.on_event("shutdown")
+async def close_http_client():
+    await app.state.save_batcher.stop()
+    await app.state.http.aclose()
+
+
 # Эндпоинты для Todoist
 @app.get("/todoist/authorize")
 def authorize_in_todoist():
@@ -42,7 +93,8 @@ def authorize_in_todoist():
 
 
 @app.get("/todoist/get-token", include_in_schema=False)
-def get_todoist_token(
+async def get_todoist_token(
+    request: Request,
     code: str = None,
     state: str = None,
     error: str = None,
@@ -54,30 +106,59 @@ def get_todoist_token(
     elif error == "access_denied":
         raise HTTPException(status_code=403, detail="User denied authorization")
 
-    authorization_token = todoist.callback(code, state, error)
-    return save_authorization_data_and_return_response(
-        authorization_token, system_name="Todoist"
+    client = request.app.state.http
+    authorization_token = await todoist.callback(client, code, state, error)
+    return await save_authorization_data_and_return_response(
+        request.app.state.save_batcher, authorization_token, system_name=TODOIST_SYSTEM_NAME
     )
 
 # Эндпоинты для GitHub
 @app.get("/github/authorize")
 def authorize_in_github():
-    auth_url = (
-        f"https://github.com/login/oauth/authorize?"
-        f"client_id={github_auth_settings.github_client_id}&"
-        f"redirect_uri={github_auth_settings.github_redirect_url}"
-    )
-    return {"url": auth_url}
+    return {"url": GITHUB_AUTH_URL}
 
 @app.get("/github/get-token", include_in_schema=False)
-def get_github_token(code: str = None, error: str = None):
+async def get_github_token(request: Request, code: str = None, error: str = None):
     if error == "access_denied":
         raise HTTPException(status_code=403, detail="User denied authorization")
     elif not code:
         raise HTTPException(status_code=400, detail="Authorization code is missing")
 
+    cached_body = _code_cache.get(code)
+    if cached_body is not None:
+        return json_response(cached_body)
+
+    # Между проверкой кэша и сохранением результата есть await, поэтому обмен регистрируется
+    # до него: одновременные повторы с тем же кодом ждут этот обмен, а не запускают свой
+    inflight = _code_inflight.get(code)
+    if inflight is not None:
+        return json_response(await asyncio.shield(inflight))
+
+    future = asyncio.get_running_loop().create_future()
+    _code_inflight[code] = future
+    try:
+        body = await _exchange_github_code(request, code)
+    except Exception as e:
+        future.set_exception(e)
+        # Ошибка передаётся ожидающим повторам; помечаем её полученной, если таких нет
+        future.exception()
+        raise
+    else:
+        future.set_result(body)
+        _code_cache.set(code, body)
+    finally:
+        if not future.done():
+            future.cancel()
+        _code_inflight.pop(code, None)
+    return json_response(body)
+
+
+async def _exchange_github_code(request: Request, code: str) -> bytes:
+    client = request.app.state.http
+
     # Обмен кода на токен
-    response = requests.post(
+    await github_token_bucket.acquire()
+    response = await client.post(
         "https://github.com/login/oauth/access_token",
         headers={"Accept": "application/json"},
         data={
@@ -86,20 +167,28 @@ def get_github_token(code: str = None, error: str = None):
             "code": code,
         },
     )
-    response.raise_for_status()
-    auth_data = response.json()
+    github_token_bucket.update_from_response(response)
+    if response.status_code >= 400:
+        raise HTTPException(status_code=502, detail="GitHub token exchange failed")
+    # Тело может оказаться не JSON, например HTML-страницей или пустым ответом прокси
+    try:
+        auth_data = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=502, detail="GitHub token exchange failed")
+    if not isinstance(auth_data, dict):
+        raise HTTPException(status_code=502, detail="GitHub token exchange failed")
 
-    # Отладочный вывод для проверки данных от GitHub
-    print("Auth Data from GitHub:", auth_data)
+    # Отладочный вывод для проверки данных от GitHub (без самого токена)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("github auth keys=%s", list(auth_data))
 
-    # Сохранение данных авторизации
-    save_response = save_authorization_data_and_return_response(auth_data, system_name="GitHub")
+    if "access_token" not in auth_data:
+        raise HTTPException(status_code=400, detail="Bad authorization code")
 
-    # Проверяем, что данные сохранены
-    print("Authorization Data after saving:", authorization_data)
+    # Сохранение на сервере хакатона идёт в фоне, не задерживая ответ пользователю
+    schedule_authorization_save(request.app.state.save_batcher, auth_data, system_name=GITHUB_SYSTEM_NAME)
 
-    return save_response
+    return _GITHUB_OK_BODY
 
 # Пример временного вызова create_issue для тестирования
 from team_actions.src.actions.GitHub.actions import create_issue
-
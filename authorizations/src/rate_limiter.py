@@ -0,0 +1,68 @@
+import asyncio
+import time
+from typing import Optional
+
+import httpx
+
+
+class TokenBucket:
+    """
+    Асинхронный token bucket для исходящих запросов к OAuth-провайдерам.
+    Скорость подстраивается по схеме AIMD: уменьшается вдвое при 429/5xx
+    и растёт на фиксированный шаг после успешных ответов.
+    Заголовки Retry-After и X-RateLimit-* приостанавливают выдачу токенов.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        max_rate: Optional[float] = None,
+        min_rate: float = 0.1,
+        increase: float = 0.5,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self.max_rate = max_rate or rate
+        self.min_rate = min_rate
+        self.increase = increase
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def update_from_response(self, response: httpx.Response) -> None:
+        status = response.status_code
+        if status == 429 or status >= 500:
+            self.rate = max(self.min_rate, self.rate * 0.5)
+        elif status < 400:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+        retry_after = response.headers.get("retry-after")
+        if retry_after and retry_after.isdigit():
+            self._block_for(float(retry_after))
+        elif response.headers.get("x-ratelimit-remaining") == "0":
+            reset = response.headers.get("x-ratelimit-reset")
+            if reset and reset.isdigit():
+                self._block_for(int(reset) - time.time())
+
+    def _block_for(self, seconds: float) -> None:
+        if seconds > 0:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
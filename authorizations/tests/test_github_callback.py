@@ -0,0 +1,98 @@
+import asyncio
+import importlib
+import sys
+import types
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+_MAIN = "authorizations.src.main"
+_SYSTEMS_CONFIG = "team_actions.src.systems_config"
+_GITHUB_ACTIONS = "team_actions.src.actions.GitHub.actions"
+
+
+@pytest.fixture
+def main(monkeypatch):
+    """
+    Импортирует main с заглушкой systems_config: main импортирует действия GitHub,
+    а настоящий systems_config при импорте запрашивает список действий у бэкенда.
+    """
+    systems_config = types.ModuleType(_SYSTEMS_CONFIG)
+    systems_config.available_actions = {}
+    systems_config.systems_info = {}
+    systems_config.system_category_of = lambda name: None
+    monkeypatch.setitem(sys.modules, _SYSTEMS_CONFIG, systems_config)
+    for name in (_MAIN, _GITHUB_ACTIONS):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    module = importlib.import_module(_MAIN)
+    yield module
+
+    for name in (_MAIN, _GITHUB_ACTIONS):
+        sys.modules.pop(name, None)
+
+
+class _Batcher:
+    async def submit(self, data):
+        return httpx.Response(200)
+
+
+def _request(handler):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(http=client, save_batcher=_Batcher())))
+
+
+def test_concurrent_callbacks_with_the_same_code_share_one_exchange(main):
+    exchanges = []
+
+    async def handler(request):
+        exchanges.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"access_token": "gho_test"})
+
+    async def run():
+        request = _request(handler)
+        first = await asyncio.gather(
+            main.get_github_token(request, code="abc"),
+            main.get_github_token(request, code="abc"),
+        )
+        replay = await main.get_github_token(request, code="abc")
+        return [*first, replay]
+
+    responses = asyncio.run(run())
+
+    assert exchanges == ["/login/oauth/access_token"]
+    assert [response.body for response in responses] == [main._GITHUB_OK_BODY] * 3
+    assert main._code_inflight == {}
+
+
+def test_failed_exchange_is_not_cached(main):
+    statuses = [500, 200]
+
+    def handler(request):
+        status = statuses.pop(0)
+        return httpx.Response(status, json={"access_token": "gho_test"})
+
+    async def run():
+        request = _request(handler)
+        with pytest.raises(main.HTTPException) as error:
+            await main.get_github_token(request, code="abc")
+        assert error.value.status_code == 502
+        return await main.get_github_token(request, code="abc")
+
+    assert asyncio.run(run()).body == main._GITHUB_OK_BODY
+    assert statuses == []
+
+
+@pytest.mark.parametrize("content", [b"", b"<html>Bad Gateway</html>", b"[]"])
+def test_non_json_token_response_is_a_bad_gateway(main, content):
+    def handler(request):
+        return httpx.Response(200, content=content)
+
+    async def run():
+        await main.get_github_token(_request(handler), code="abc")
+
+    with pytest.raises(main.HTTPException) as error:
+        asyncio.run(run())
+    assert error.value.status_code == 502
@@ -0,0 +1,56 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from authorizations.src import rate_limiter
+from authorizations.src.rate_limiter import TokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Подменяет часы и asyncio.sleep в модуле rate_limiter: ожидание мгновенно сдвигает время вперёд."""
+    now = [1000.0]
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(monotonic=lambda: now[0], time=time.time))
+    monkeypatch.setattr(rate_limiter, "asyncio", SimpleNamespace(Lock=asyncio.Lock, sleep=sleep))
+    return sleeps
+
+
+def test_retry_after_blocks_acquire(clock):
+    bucket = TokenBucket(rate=10, capacity=5)
+
+    bucket.update_from_response(httpx.Response(429, headers={"Retry-After": "3"}))
+    asyncio.run(bucket.acquire())
+
+    assert bucket.rate == 5
+    assert clock == [3.0]
+
+
+def test_http_date_retry_after_does_not_block(clock):
+    bucket = TokenBucket(rate=10, capacity=5)
+
+    bucket.update_from_response(
+        httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"})
+    )
+    asyncio.run(bucket.acquire())
+
+    assert bucket.rate == 5
+    assert clock == []
+
+
+def test_success_restores_rate_up_to_max(clock):
+    bucket = TokenBucket(rate=10, capacity=5, increase=4)
+
+    bucket.update_from_response(httpx.Response(429))
+    bucket.update_from_response(httpx.Response(200))
+    assert bucket.rate == 9
+    bucket.update_from_response(httpx.Response(200))
+    assert bucket.rate == 10
@@ -0,0 +1,85 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from authorizations.src import hackathon_utils
+from authorizations.src.hackathon_utils import SaveAuthorizationBatcher
+
+_SAVE_URL = "https://backend.test/save"
+_BATCH_URL = "https://backend.test/save-batch"
+
+
+@pytest.fixture
+def batch_endpoint(monkeypatch):
+    monkeypatch.setattr(
+        hackathon_utils,
+        "base_hackathon_settings",
+        SimpleNamespace(save_auth_data_endpoint=_SAVE_URL, save_auth_data_batch_endpoint=_BATCH_URL),
+    )
+
+
+async def _submit_all(handler, payloads):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        batcher = SaveAuthorizationBatcher(client, max_wait=0.05)
+        batcher.start()
+        try:
+            responses = await asyncio.gather(*(batcher.submit(data) for data in payloads))
+        finally:
+            await batcher.stop()
+    return batcher, responses
+
+
+def test_unsupported_batch_endpoint_falls_back_to_single_saves(batch_endpoint):
+    calls = []
+
+    def handler(request):
+        calls.append(str(request.url))
+        if request.url == _BATCH_URL:
+            return httpx.Response(404)
+        return httpx.Response(200)
+
+    batcher, responses = asyncio.run(_submit_all(handler, [{"n": 1}, {"n": 2}]))
+
+    assert [response.status_code for response in responses] == [200, 200]
+    assert calls == [_BATCH_URL, _SAVE_URL, _SAVE_URL]
+    assert not batcher._batch_supported
+
+
+def test_supported_batch_endpoint_saves_in_one_request(batch_endpoint):
+    calls = []
+
+    def handler(request):
+        calls.append(str(request.url))
+        return httpx.Response(200)
+
+    _, responses = asyncio.run(_submit_all(handler, [{"n": 1}, {"n": 2}]))
+
+    assert [response.status_code for response in responses] == [200, 200]
+    assert calls == [_BATCH_URL]
+
+
+def test_flush_error_reaches_waiters_and_batcher_keeps_running(batch_endpoint, monkeypatch):
+    def handler(request):
+        return httpx.Response(200)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            batcher = SaveAuthorizationBatcher(client, max_wait=0.01)
+            flush = batcher._flush
+
+            async def failing_once(batch):
+                monkeypatch.setattr(batcher, "_flush", flush)
+                raise RuntimeError("boom")
+
+            monkeypatch.setattr(batcher, "_flush", failing_once)
+            batcher.start()
+            try:
+                with pytest.raises(RuntimeError):
+                    await batcher.submit({"n": 1})
+                return await batcher.submit({"n": 2})
+            finally:
+                await batcher.stop()
+
+    assert asyncio.run(run()).status_code == 200
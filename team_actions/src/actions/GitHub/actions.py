@@ -1,7 +1,30 @@
-from typing import Annotated, Optional, List, Literal
+import asyncio
+import binascii
+import importlib.util
+import inspect
+import io
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from typing import Annotated, Any, Callable, Optional, List, Literal, Union
 from pydantic import BaseModel, Field, HttpUrl
 from team_actions.src.registration import register_action
+from team_actions.src.settings import get_settings
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # без orjson используется стандартный json
+    orjson = None
 
 # 1. Определение типов данных и структур данных (Pydantic модели)
 
@@ -13,13 +36,14 @@ BodyContent = Annotated[Optional[str], Field(description="Content of the issue o
 Label = Annotated[str, Field(description="Label associated with the issue or pull request")]
 
 # Дата и время создания в формате ISO 8601
+_DT_PATTERN = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z$"
+
+# В моделях шаблон проверяет pydantic-core: он компилируется один раз вместе со схемой,
+# и это быстрее, чем вызов Python-валидатора на каждое поле
 Datetime = Annotated[
     str,
     Field(
-        pattern=(
-            r"^\d{4}-\d{2}-\d{2}T\d{2}:"
-            r"\d{2}:\d{2}(\.\d+)?Z$"
-        ),
+        pattern=_DT_PATTERN,
         description="Datetime in ISO 8601 format"
     )
 ]
@@ -67,6 +91,520 @@ class PullRequest(BaseModel):
 
 # 2. Определение функции действия create_issue
 
+# Шаблоны URL GitHub API: собираются один раз при загрузке модуля и заполняются через format_map
+_API = "https://api.github.com"
+_U_GRAPHQL = _API + "/graphql"
+_U_USER_REPOS = _API + "/user/repos"
+_U_STARRED = _API + "/user/starred/{repo}"
+_U_REPO = _API + "/repos/{repo}"
+_U_ISSUES = _U_REPO + "/issues"
+_U_ISSUE = _U_ISSUES + "/{n}"
+_U_BRANCHES = _U_REPO + "/branches"
+_U_REFS = _U_REPO + "/git/refs"
+_U_BRANCH_REF = _U_REFS + "/heads/{branch}"
+_U_CONTENTS = _U_REPO + "/contents/{p}"
+_U_PULLS = _U_REPO + "/pulls"
+_U_PULL = _U_PULLS + "/{n}"
+_U_PULL_MERGE = _U_PULL + "/merge"
+_U_SEARCH_ISSUES = _API + "/search/issues"
+
+# Общая HTTP-сессия: keep-alive соединения с api.github.com переиспользуются между действиями.
+# pool_maxsize рассчитан на параллельный запуск действий в нескольких потоках.
+# Временные ошибки сервера, после которых запрос повторяется
+_RETRY_STATUSES = (500, 502, 503, 504)
+# Методы, которые можно безопасно повторить после ошибки сервера или обрыва соединения
+_IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "PATCH", "DELETE"})
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        # Временные 5xx и обрывы соединения повторяются внутри пула, на том же keep-alive соединении.
+        # 429 здесь не повторяется: его обрабатывает _do вместе со сменой токена.
+        # POST не повторяется: GitHub не поддерживает ключи идемпотентности, и повтор после 502/504,
+        # пришедшего уже после создания задачи или pull request, создал бы дубликат
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=_IDEMPOTENT_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    ),
+)
+_API_VERSION = "2022-11-28"
+# brotli сжимает JSON GitHub сильнее gzip; запрашиваем его, только если установлен декодер,
+# иначе сервер может прислать ответ, который не получится распаковать
+if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
+    _ACCEPT_ENCODING = "gzip, br"
+else:
+    _ACCEPT_ENCODING = "gzip"
+_DEFAULT_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "User-Agent": "team_actions/1.0",
+    "Accept-Encoding": _ACCEPT_ENCODING,
+    "X-GitHub-Api-Version": _API_VERSION,
+}
+_SESSION.headers.update(_DEFAULT_HEADERS)
+
+# HTTP/2-клиент httpx: параллельные запросы мультиплексируются в одном TCP+TLS соединении.
+# Используется, если не отключён настройкой github_use_httpx (переменная окружения
+# GITHUB_USE_HTTPX); иначе запросы идут через requests.
+# Клиент создаётся один раз на модуль, поэтому SSL-контекст и CA-бандл загружаются однократно.
+USE_HTTPX = get_settings().github_use_httpx
+_CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+    ),
+    headers=_DEFAULT_HEADERS,
+    timeout=httpx.Timeout(10.0, connect=3.0),
+    # Как и requests, следуем 301/307 GitHub для переименованных и перенесённых репозиториев
+    follow_redirects=True,
+)
+
+
+# Пул токенов: authorization_data["GitHub"]["access_tokens"] — список токенов, лимит запросов
+# GitHub считается для каждого токена отдельно. Состояние лимита обновляется по заголовкам
+# X-RateLimit-Remaining / X-RateLimit-Reset каждого ответа, отдельно для основного API,
+# поиска (/search/*, 30 запросов в минуту) и GraphQL.
+_RATE_LIMIT_DEFAULTS = {"core": 5000, "search": 30, "graphql": 5000}
+# Запас запросов, ниже которого токен считается исчерпанным до сброса лимита
+_RATE_LIMIT_FLOORS = {"core": 50, "search": 2, "graphql": 50}
+_TOKEN_STATE: dict[tuple[str, str], dict[str, float]] = {}
+_TOKEN_LOCK = threading.Lock()
+_token_turn = itertools.count()
+
+# Повторы при ответах 403/429 из-за лимитов: число попыток и начальная/максимальная пауза в секундах
+_RATE_LIMIT_ATTEMPTS = 5
+_BACKOFF_BASE = 1.0
+_BACKOFF_MAX = 60.0
+
+
+@lru_cache(maxsize=64)
+def _auth_header(token: str) -> bytes:
+    # Значение заголовка кодируется в байты один раз на токен, а не при каждом запросе.
+    # Байты принимают оба транспорта _do: и requests, и httpx передают их без перекодирования
+    return f"Bearer {token}".encode("ascii")
+
+
+@lru_cache(maxsize=64)
+def _auth_headers(token: str) -> dict[str, str]:
+    # Готовый набор заголовков для клиентов вне общей сессии (асинхронные действия).
+    # Словарь общий для всех вызовов с этим токеном, поэтому изменять его нельзя — только копировать.
+    return {**_DEFAULT_HEADERS, "Authorization": f"Bearer {token}"}
+
+
+def _tokens() -> List[str]:
+    github_data = authorization_data.get("GitHub", {})
+    tokens = github_data.get("access_tokens")
+    if tokens:
+        return tokens
+    token = github_data.get("access_token")
+    return [token] if token else []
+
+
+def _get_token() -> str:
+    # Основной токен пула. Общие сессия и клиент не хранят заголовок Authorization:
+    # _do подставляет его в каждый запрос для выбранного токена, поэтому действия,
+    # выполняемые параллельно в разных потоках, не могут отправить чужой токен
+    tokens = _tokens()
+    if not tokens:
+        raise ValueError("Authorization token for GitHub is missing.")
+    return tokens[0]
+
+
+def _token_pool_key() -> tuple:
+    # Ключ кэшей ответов: ответ мог быть получен любым токеном пула
+    return tuple(_tokens())
+
+
+def _refresh_auth() -> None:
+    """Сбрасывает состояние лимитов токенов после изменения authorization_data."""
+    with _TOKEN_LOCK:
+        _TOKEN_STATE.clear()
+
+
+def _rate_limit_bucket(url: str) -> str:
+    if "/search/" in url:
+        return "search"
+    if url.endswith("/graphql"):
+        return "graphql"
+    return "core"
+
+
+def _token_state(token: str, bucket: str) -> dict[str, float]:
+    # Вызывается под _TOKEN_LOCK
+    return _TOKEN_STATE.setdefault((token, bucket), {"remaining": _RATE_LIMIT_DEFAULTS[bucket], "reset": 0.0})
+
+
+def _choose_token(bucket: str) -> tuple[str, float]:
+    # Выбираем токен с наибольшим остатком лимита; при равенстве — по кругу.
+    # Вторым значением возвращается пауза до сброса лимита: она ненулевая,
+    # только если исчерпаны все токены пула.
+    tokens = _tokens()
+    if not tokens:
+        raise ValueError("Authorization token for GitHub is missing.")
+
+    floor = _RATE_LIMIT_FLOORS[bucket]
+    now = time.time()
+    with _TOKEN_LOCK:
+        turn = next(_token_turn) % len(tokens)
+        best_token, best_remaining, earliest_reset = None, -1.0, float("inf")
+        for token in tokens[turn:] + tokens[:turn]:
+            state = _token_state(token, bucket)
+            if state["reset"] and state["reset"] <= now:
+                state["remaining"], state["reset"] = _RATE_LIMIT_DEFAULTS[bucket], 0.0
+            if state["remaining"] > best_remaining:
+                best_token, best_remaining = token, state["remaining"]
+            if state["remaining"] < floor:
+                earliest_reset = min(earliest_reset, state["reset"] or now)
+    if best_remaining >= floor or earliest_reset <= now:
+        return best_token, 0.0
+    return best_token, earliest_reset - now
+
+
+def _pick_token(bucket: str = "core") -> str:
+    while True:
+        token, wait = _choose_token(bucket)
+        if not wait:
+            return token
+        time.sleep(wait)
+
+
+def _update_token_state(token: str, bucket: str, response: Any) -> None:
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    if remaining is None:
+        return
+    with _TOKEN_LOCK:
+        state = _token_state(token, bucket)
+        state["remaining"] = float(remaining)
+        state["reset"] = float(response.headers.get("X-RateLimit-Reset", 0))
+
+
+def _retry_delay(response: Any, delay: float) -> Optional[float]:
+    # Пауза перед повтором запроса после ответа 403/429 из-за лимитов GitHub; None — не повторять
+    if response.status_code not in (403, 429):
+        return None
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        # Первичный лимит токена исчерпан: при выборе токена возьмётся другой или дождёмся сброса
+        return 0.0
+
+    retry_after = response.headers.get("Retry-After")
+    secondary = "secondary rate limit" in response.text.lower()
+    if retry_after is None and not secondary and response.status_code == 403:
+        # Обычный 403 (нет прав) не повторяем
+        return None
+
+    # Retry-After в секундах задаёт паузу явно; в остальных случаях (нет заголовка или в нём
+    # HTTP-дата) — экспоненциальная пауза со случайным разбросом
+    if retry_after is not None and retry_after.isdigit():
+        wait = float(retry_after)
+    else:
+        wait = delay * (1 + random.random())
+    if secondary:
+        wait *= 2
+    return min(wait, _BACKOFF_MAX)
+
+
+def _server_error_delay(response: Any, delay: float) -> Optional[float]:
+    # Пауза перед повтором после временной ошибки сервера (502/503/504); None — не повторять
+    if response.status_code not in _RETRY_STATUSES:
+        return None
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None and retry_after.isdigit():
+        return min(float(retry_after), _BACKOFF_MAX)
+    return delay * (1 + random.random())
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _do(method: str, url: str, retry: Optional[bool] = None, **kwargs: Any) -> Any:
+    # Все действия отправляют запросы через эту функцию: здесь выбираются транспорт и токен,
+    # а ответы 403/429 из-за лимитов GitHub повторяются с паузой вместо немедленной ошибки.
+    # retry: повторять ли запрос после 5xx и обрыва соединения; по умолчанию только для
+    # идемпотентных методов (POST-запрос на чтение, например GraphQL-запрос, включает его явно)
+    if retry is None:
+        retry = method in _IDEMPOTENT_METHODS
+    extra_headers = kwargs.pop("headers", None) or {}
+    stream = kwargs.pop("stream", False)
+    body = None
+    if "json" in kwargs:
+        # Тело сериализуется один раз, в байты, и переиспользуется при повторах
+        body = _dumps(kwargs.pop("json"))
+        extra_headers = {**extra_headers, "Content-Type": "application/json"}
+    bucket = _rate_limit_bucket(url)
+    delay = _BACKOFF_BASE
+    for attempt in range(_RATE_LIMIT_ATTEMPTS):
+        token = _pick_token(bucket)
+        # Заголовок выбранного токена передаётся в самом запросе, а не выставляется на общей сессии;
+        # значение — готовые байты из _auth_header для любого транспорта
+        headers = {**extra_headers, "Authorization": _auth_header(token)}
+
+        via_httpx = USE_HTTPX
+        if via_httpx:
+            request = _CLIENT.build_request(method, url, headers=headers, content=body, **kwargs)
+            try:
+                response = _CLIENT.send(request, stream=stream)
+            except httpx.TransportError:
+                # Транспорт httpx сам повторяет только ошибки установки соединения;
+                # таймауты и обрывы чтения повторяем здесь, как Retry у requests
+                if not retry or attempt == _RATE_LIMIT_ATTEMPTS - 1:
+                    raise
+                time.sleep(delay * (1 + random.random()))
+                delay = min(delay * 2, _BACKOFF_MAX)
+                continue
+        else:
+            response = _SESSION.request(method, url, headers=headers, data=body, stream=stream, **kwargs)
+        _update_token_state(token, bucket, response)
+
+        wait = _retry_delay(response, delay)
+        if wait is None and retry and (via_httpx or method not in _IDEMPOTENT_METHODS):
+            # 5xx идемпотентных запросов на requests повторяет Retry адаптера сессии, остальные — этот цикл
+            wait = _server_error_delay(response, delay)
+        if wait is None or attempt == _RATE_LIMIT_ATTEMPTS - 1:
+            # Последний ответ возвращается открытым: при stream=True его тело ещё читает вызывающий код
+            return response
+        response.close()
+        if wait:
+            time.sleep(wait)
+            delay = min(delay * 2, _BACKOFF_MAX)
+
+
+def _finish(response: Any) -> Any:
+    # Общее завершение действия: ошибка HTTP становится исключением, тело ответа разбирается из байтов.
+    # Лимиты запросов по заголовкам ответа уже учтены в _do, ETag-кэш ведёт _cached_get
+    response.raise_for_status()
+    return _loads(response.content)
+
+
+# Кэш условных GET-запросов: (пул токенов, URL, параметры) -> (ETag, тело ответа в байтах).
+# Ответ 304 Not Modified почти ничего не весит и не расходует лимит запросов GitHub.
+_ETAG_CACHE_MAXSIZE = 512
+_ETAG_CACHE: OrderedDict[tuple, tuple[str, bytes]] = OrderedDict()
+_ETAG_LOCK = threading.Lock()
+
+
+def _cached_get(url: str, params: Optional[dict] = None) -> Any:
+    # _do может отправить запрос любым токеном пула, поэтому ключ — весь пул, а не один токен
+    key = (_token_pool_key(), url, tuple(sorted((params or {}).items())))
+    headers = {}
+    with _ETAG_LOCK:
+        cached = _ETAG_CACHE.get(key)
+    if cached is not None:
+        headers["If-None-Match"] = cached[0]
+
+    response = _do("GET", url, headers=headers, params=params)
+    if response.status_code == 304 and cached is not None:
+        with _ETAG_LOCK:
+            if key in _ETAG_CACHE:
+                _ETAG_CACHE.move_to_end(key)
+        # Каждый вызов получает собственную копию данных: изменения вызывающего кода не попадут в кэш
+        return _loads(cached[1])
+
+    data = _finish(response)
+    etag = response.headers.get("ETag")
+    if etag:
+        with _ETAG_LOCK:
+            # Храним исходные байты ответа, а не разобранный объект, который получает вызывающий код
+            _ETAG_CACHE[key] = (etag, response.content)
+            _ETAG_CACHE.move_to_end(key)
+            while len(_ETAG_CACHE) > _ETAG_CACHE_MAXSIZE:
+                _ETAG_CACHE.popitem(last=False)
+    return data
+
+
+# Короткоживущий кэш ответов идемпотентных GET-действий: повторные чтения тех же данных
+# в пределах TTL не уходят в сеть. Ключ: (имя действия, аргументы..., пул токенов).
+_TTL_CACHE_MAXSIZE = 1024
+_TTL_CACHE: dict[tuple, tuple[float, bytes]] = {}
+_TTL_LOCK = threading.Lock()
+
+
+def _freeze(value: Any) -> Any:
+    # Списки в аргументах (например, labels) приводим к хешируемому виду
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def _ttl_cache(ttl: float) -> Callable:
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (func.__name__, *(_freeze(value) for value in bound.arguments.values()), _token_pool_key())
+
+            now = time.monotonic()
+            with _TTL_LOCK:
+                cached = _TTL_CACHE.get(key)
+                if cached is not None:
+                    if now <= cached[0]:
+                        # Ответ хранится сериализованным: каждый вызов получает собственную копию
+                        return _loads(cached[1])
+                    del _TTL_CACHE[key]
+
+            value = func(*args, **kwargs)
+            encoded = _dumps(value)
+            with _TTL_LOCK:
+                if len(_TTL_CACHE) >= _TTL_CACHE_MAXSIZE:
+                    for expired_key in [k for k, (expires_at, _) in _TTL_CACHE.items() if expires_at < now]:
+                        del _TTL_CACHE[expired_key]
+                    if len(_TTL_CACHE) >= _TTL_CACHE_MAXSIZE:
+                        _TTL_CACHE.clear()
+                _TTL_CACHE[key] = (now + ttl, encoded)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate(func: Callable, *args: Any) -> None:
+    """Удаляет из TTL-кэша ответы действия func, чьи первые аргументы совпадают с args."""
+    prefix = (func.__name__, *(_freeze(arg) for arg in args))
+    with _TTL_LOCK:
+        for key in [key for key in _TTL_CACHE if key[:len(prefix)] == prefix]:
+            del _TTL_CACHE[key]
+
+
+def _compact(**kwargs: Any) -> dict:
+    # Ключи со значением None не отправляются: GitHub не разбирает лишние поля,
+    # а "body": null не затирает существующее содержимое
+    return {k: v for k, v in kwargs.items() if v is not None}
+
+
+# Проверки аргументов до сетевого запроса: заведомо неверные значения не тратят RTT и лимит запросов
+_REPO_RE = re.compile(r"^[A-Za-z0-9._-]+/[A-Za-z0-9._-]+\Z")
+_BRANCH_RE = re.compile(r"^[A-Za-z0-9._/-]+\Z")
+
+
+def _check_args(
+    repo: str, branch: Optional[str] = None, file_path: Optional[str] = None, number: Optional[int] = None
+) -> None:
+    if not _REPO_RE.match(repo):
+        raise ValueError(f"Invalid repo: {repo!r}")
+    if branch is not None and not _BRANCH_RE.match(branch):
+        raise ValueError(f"Invalid branch: {branch!r}")
+    if file_path is not None and (not file_path or ".." in file_path.split("/")):
+        raise ValueError(f"Invalid file path: {file_path!r}")
+    if number is not None and number <= 0:
+        raise ValueError(f"Invalid number: {number!r}")
+
+
+def _b64encode(content: Union[str, bytes]) -> str:
+    # Байты кодируются без промежуточной копии через encode('utf-8')
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return binascii.b2a_base64(content, newline=False).decode("ascii")
+
+
+# Известные SHA файлов: (репозиторий, ветка, путь) -> SHA. Позволяют обновлять и удалять файлы
+# без предварительного запроса содержимого. Размер ограничен, как у ETag-кэша: вытесняются
+# давно не использованные записи.
+_FILE_SHA_MAXSIZE = 1024
+_FILE_SHA: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+_FILE_SHA_LOCK = threading.Lock()
+
+
+def _remember_sha(repo: str, branch: str, file_path: str, sha: str) -> None:
+    key = (repo, branch, file_path)
+    with _FILE_SHA_LOCK:
+        _FILE_SHA[key] = sha
+        _FILE_SHA.move_to_end(key)
+        while len(_FILE_SHA) > _FILE_SHA_MAXSIZE:
+            _FILE_SHA.popitem(last=False)
+
+
+def _forget_sha(repo: str, branch: str, file_path: str) -> None:
+    with _FILE_SHA_LOCK:
+        _FILE_SHA.pop((repo, branch, file_path), None)
+
+
+def _file_sha(repo: str, file_path: str, branch: str, refresh: bool = False) -> str:
+    key = (repo, branch, file_path)
+    if not refresh:
+        with _FILE_SHA_LOCK:
+            sha = _FILE_SHA.get(key)
+            if sha is not None:
+                _FILE_SHA.move_to_end(key)
+                return sha
+
+    # Получаем текущий SHA файла
+    file_data = _cached_get(
+        _U_CONTENTS.format_map({"repo": repo, "p": file_path}), params={"ref": branch}
+    )
+    _remember_sha(repo, branch, file_path, file_data["sha"])
+    return file_data["sha"]
+
+
+# Файлы скачиваются в исходном виде (без JSON и base64) частями по 64 КБ
+_RAW_ACCEPT = "application/vnd.github.raw+json"
+_RAW_CHUNK_SIZE = 65536
+_SHA_RE = re.compile(r"[0-9a-f]{40}")
+
+
+def _stream_file(repo: str, file_path: str, branch: str, sink: Callable[[bytes], Any]) -> None:
+    # Передаёт содержимое файла в sink по частям, не держа весь ответ в памяти
+    response = _do(
+        "GET",
+        _U_CONTENTS.format_map({"repo": repo, "p": file_path}),
+        headers={"Accept": _RAW_ACCEPT},
+        params={"ref": branch},
+        stream=True,
+    )
+    try:
+        response.raise_for_status()
+        # ETag исходного содержимого — SHA blob-объекта: запоминаем его для update_file/delete_file.
+        # Если SHA окажется неверным, запись файла повторится с актуальным SHA.
+        etag = response.headers.get("ETag", "").removeprefix("W/").strip('"')
+        if _SHA_RE.fullmatch(etag):
+            _remember_sha(repo, branch, file_path, etag)
+
+        chunks = (
+            response.iter_content(_RAW_CHUNK_SIZE)
+            if hasattr(response, "iter_content")
+            else response.iter_bytes(_RAW_CHUNK_SIZE)
+        )
+        for chunk in chunks:
+            sink(chunk)
+    finally:
+        response.close()
+
+
+def download_file_to(path: str, repo: str, file_path: str, branch: str = "main") -> None:
+    """
+    Скачивает файл из репозитория GitHub сразу на диск, частями по 64 КБ.
+
+    Args:
+        path (str): Локальный путь, куда записывается файл.
+        repo (str): Полное имя репозитория в формате "owner/repo".
+        file_path (str): Путь к файлу в репозитории.
+        branch (str): Имя ветки, откуда извлекается файл (по умолчанию 'main').
+    """
+    _check_args(repo, branch=branch, file_path=file_path)
+
+    _get_token()
+    with open(path, "wb") as file:
+        _stream_file(repo, file_path, branch, file.write)
+
+
 authorization_data = {}  # Словарь authorization_data заполняется автоматически после регистрации действий
 
 @register_action(
@@ -94,31 +632,25 @@ def create_issue(repo: str, title: str, body: Optional[str] = None, labels: Opti
     Returns:
         dict: Данные о созданной задаче.
     """
+    _check_args(repo)
+
     # Логика функции здесь
 
 
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
     # Выполняем запрос для создания нового issue
-    response = requests.post(
-        f"https://api.github.com/repos/{repo}/issues",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        },
-        json={
-            "title": title,
-            "body": body,
-            "labels": labels
-        }
+    response = _do(
+        "POST",
+        _U_ISSUES.format_map({"repo": repo}),
+        json=_compact(title=title, body=body, labels=labels)
     )
 
     # Проверяем успешность запроса и возвращаем данные о задаче
-    response.raise_for_status()
-    return response.json()
+    data = _finish(response)
+    invalidate(list_issues, repo)
+    return data
 
 @register_action(
     system_type="version_control_system",
@@ -139,28 +671,18 @@ def create_repository(name: str, description: Optional[str] = None, private: boo
     Returns:
         dict: Данные о созданном репозитории.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
     # Выполняем запрос для создания нового репозитория
-    response = requests.post(
-        "https://api.github.com/user/repos",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        },
-        json={
-            "name": name,
-            "description": description,
-            "private": private
-        }
+    response = _do(
+        "POST",
+        _U_USER_REPOS,
+        json=_compact(name=name, description=description, private=private)
     )
 
     # Проверяем успешность запроса и возвращаем данные о репозитории
-    response.raise_for_status()
-    return response.json()
+    return _finish(response)
 
 @register_action(
     system_type="version_control_system",
@@ -179,22 +701,20 @@ def delete_repository(repo: str) -> dict:
     Returns:
         dict: Сообщение о результате операции.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    _check_args(repo)
+
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
     # Выполняем запрос для удаления репозитория
-    response = requests.delete(
-        f"https://api.github.com/repos/{repo}",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        }
+    response = _do(
+        "DELETE",
+        _U_REPO.format_map({"repo": repo})
     )
 
     # Проверяем успешность запроса и возвращаем сообщение о результате
     if response.status_code == 204:
+        invalidate(get_repository_info, repo)
         return {"message": "Repository deleted successfully."}
     else:
         response.raise_for_status()
@@ -207,6 +727,7 @@ def delete_repository(repo: str) -> dict:
     arguments=["repo", "issue_number"],
     description="Retrieves information about a specific issue in the specified GitHub repository."
 )
+@_ttl_cache(ttl=30)
 def get_issue(repo: str, issue_number: int) -> dict:
     """
     Получает информацию о задаче (issue) в указанном репозитории GitHub.
@@ -218,23 +739,13 @@ def get_issue(repo: str, issue_number: int) -> dict:
     Returns:
         dict: Данные о задаче, включая название, описание, статус и метки.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    _check_args(repo, number=issue_number)
 
-    # Выполняем запрос для получения информации о задаче
-    response = requests.get(
-        f"https://api.github.com/repos/{repo}/issues/{issue_number}",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        }
-    )
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
-    # Проверяем успешность запроса и возвращаем данные о задаче
-    response.raise_for_status()
-    return response.json()
+    # Выполняем запрос для получения информации о задаче
+    return _cached_get(_U_ISSUE.format_map({"repo": repo, "n": issue_number}))
 
 @register_action(
     system_type="version_control_system",
@@ -258,34 +769,26 @@ def update_issue(repo: str, issue_number: int, title: Optional[str] = None, body
     Returns:
         dict: Обновлённые данные о задаче.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    _check_args(repo, number=issue_number)
+
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
     # Подготовка данных для обновления
-    data = {
-        "title": title,
-        "body": body,
-        "state": state,
-        "assignees": assignees
-    }
-    # Удаляем ключи с None значениями
-    data = {k: v for k, v in data.items() if v is not None}
+    data = _compact(title=title, body=body, state=state, assignees=assignees)
 
     # Выполняем запрос для обновления информации о задаче
-    response = requests.patch(
-        f"https://api.github.com/repos/Fugaret/{repo}/issues/{issue_number}",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        },
+    response = _do(
+        "PATCH",
+        _U_ISSUE.format_map({"repo": repo, "n": issue_number}),
         json=data
     )
 
     # Проверяем успешность запроса и возвращаем данные о задаче
-    response.raise_for_status()
-    return response.json()
+    data = _finish(response)
+    invalidate(get_issue, repo, issue_number)
+    invalidate(list_issues, repo)
+    return data
 
 @register_action(
     system_type="version_control_system",
@@ -305,24 +808,23 @@ def close_issue(repo: str, issue_number: int) -> dict:
     Returns:
         dict: Обновлённые данные о задаче, подтверждающие её закрытие.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    _check_args(repo, number=issue_number)
+
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
     # Выполняем запрос для закрытия задачи
-    response = requests.patch(
-        f"https://api.github.com/repos/Fugaret/{repo}/issues/{issue_number}",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        },
+    response = _do(
+        "PATCH",
+        _U_ISSUE.format_map({"repo": repo, "n": issue_number}),
         json={"state": "closed"}
     )
 
     # Проверяем успешность запроса и возвращаем данные о задаче
-    response.raise_for_status()
-    return response.json()
+    data = _finish(response)
+    invalidate(get_issue, repo, issue_number)
+    invalidate(list_issues, repo)
+    return data
 
 @register_action(
     system_type="version_control_system",
@@ -331,6 +833,7 @@ def close_issue(repo: str, issue_number: int) -> dict:
     arguments=["repo", "state", "labels", "assignee"],
     description="Retrieves a list of issues from the specified GitHub repository, filtered by state, labels, and assignee."
 )
+@_ttl_cache(ttl=30)
 def list_issues(repo: str, state: Optional[str] = None, labels: Optional[List[str]] = None, assignee: Optional[str] = None) -> list:
     """
     Получает список задач (issues) в указанном репозитории GitHub, с возможностью фильтрации по статусу, меткам и исполнителю.
@@ -344,33 +847,159 @@ def list_issues(repo: str, state: Optional[str] = None, labels: Optional[List[st
     Returns:
         list: Список задач, соответствующих указанным фильтрам.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    _check_args(repo)
+
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
     # Подготовка параметров запроса
-    params = {
-        "state": state or "open",
-        "labels": ",".join(labels) if labels else None,
-        "assignee": assignee
-    }
-    # Удаляем ключи с None значениями
-    params = {k: v for k, v in params.items() if v is not None}
+    params = _compact(
+        state=state or "open",
+        labels=",".join(labels) if labels else None,
+        assignee=assignee
+    )
 
     # Выполняем запрос для получения списка задач
-    response = requests.get(
-        f"https://api.github.com/repos/{repo}/issues",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        },
-        params=params
+    return _cached_get(_U_ISSUES.format_map({"repo": repo}), params=params)
+
+# Поля задачи, запрашиваемые через GraphQL
+_ISSUE_FIELDS_FRAGMENT = """
+fragment IssueFields on Issue {
+  id
+  number
+  title
+  state
+  body
+  labels(first: 20) { nodes { name color } }
+  createdAt
+  updatedAt
+  closedAt
+  url
+}
+"""
+
+_LIST_ISSUES_QUERY = """
+query($owner: String!, $name: String!, $states: [IssueState!], $labels: [String!], $after: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, states: $states, labels: $labels, after: $after) {
+      nodes { ...IssueFields }
+      pageInfo { endCursor hasNextPage }
+    }
+  }
+}
+""" + _ISSUE_FIELDS_FRAGMENT
+
+_GRAPHQL_ISSUE_STATES = {"open": ["OPEN"], "closed": ["CLOSED"], "all": ["OPEN", "CLOSED"]}
+
+
+def _graphql(query: str, variables: dict, allow_partial: bool = True, retry: bool = True) -> dict:
+    # allow_partial=False: любая ошибка в ответе считается неудачей (нужно для мутаций)
+    # retry=False: не повторять после 5xx и обрыва соединения (мутации могли уже выполниться)
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
+
+    response = _do(
+        "POST",
+        _U_GRAPHQL,
+        retry=retry,
+        json={"query": query, "variables": variables}
     )
+    result = _finish(response)
+    if result.get("data") is None or (not allow_partial and result.get("errors")):
+        raise ValueError(f"GitHub GraphQL request failed: {result.get('errors')}")
+    return result["data"]
+
+
+def _graphql_repository(query: str, variables: dict, **kwargs: Any) -> dict:
+    # Поле repository запроса; для несуществующего или недоступного репозитория GitHub
+    # возвращает repository: null вместе с errors — сообщаем об этом явно
+    repository = _graphql(query, variables, **kwargs)["repository"]
+    if repository is None:
+        raise ValueError(f"Repository {variables['owner']}/{variables['name']} not found or not accessible")
+    return repository
+
+
+def _issue_from_graphql(node: Optional[dict]) -> Optional[dict]:
+    # Приводим задачу из GraphQL к плоскому виду с именами полей REST API.
+    # Это подмножество полей REST: id, user, url и другие не запрашиваются
+    if node is None:
+        return None
+    return {
+        "node_id": node["id"],
+        "number": node["number"],
+        "title": node["title"],
+        "state": node["state"].lower(),
+        "body": node["body"],
+        "labels": node["labels"]["nodes"],
+        "created_at": node["createdAt"],
+        "updated_at": node["updatedAt"],
+        "closed_at": node["closedAt"],
+        "html_url": node["url"],
+    }
 
-    # Проверяем успешность запроса и возвращаем список задач
-    response.raise_for_status()
-    return response.json()
+
+def get_issues_graphql(repo: str, numbers: List[int]) -> List[Optional[dict]]:
+    """
+    Получает несколько задач (issues) репозитория GitHub одним GraphQL-запросом.
+
+    Args:
+        repo (str): Полное имя репозитория в формате "owner/repo".
+        numbers (List[int]): Номера задач в репозитории.
+
+    Returns:
+        List[Optional[dict]]: Данные о задачах в порядке переданных номеров (None для несуществующих):
+            node_id, number, title, state, body, labels, created_at, updated_at, closed_at и html_url.
+    """
+    _check_args(repo)
+
+    if not numbers:
+        return []
+
+    owner, name = repo.split("/", 1)
+    aliases = " ".join(
+        f"i{idx}: issue(number: {int(number)}) {{ ...IssueFields }}"
+        for idx, number in enumerate(numbers)
+    )
+    query = (
+        "query($owner: String!, $name: String!) { repository(owner: $owner, name: $name) { "
+        + aliases
+        + " } }"
+        + _ISSUE_FIELDS_FRAGMENT
+    )
+    repository = _graphql_repository(query, {"owner": owner, "name": name})
+    return [_issue_from_graphql(repository.get(f"i{idx}")) for idx in range(len(numbers))]
+
+
+def list_issues_graphql(repo: str, state: Optional[str] = None, labels: Optional[List[str]] = None) -> list:
+    """
+    Получает все задачи (issues) репозитория GitHub через GraphQL, по 100 задач за запрос.
+
+    Args:
+        repo (str): Полное имя репозитория в формате "owner/repo".
+        state (Optional[str]): Фильтр по статусу задачи ('open', 'closed' или 'all').
+        labels (Optional[List[str]]): Список меток для фильтрации.
+
+    Returns:
+        list: Список задач, соответствующих указанным фильтрам, с теми же полями, что и get_issues_graphql.
+    """
+    _check_args(repo)
+
+    owner, name = repo.split("/", 1)
+    variables = {
+        "owner": owner,
+        "name": name,
+        "states": _GRAPHQL_ISSUE_STATES[state or "open"],
+        "labels": labels,
+        "after": None,
+    }
+
+    issues = []
+    while True:
+        page = _graphql_repository(_LIST_ISSUES_QUERY, variables)["issues"]
+        issues.extend(_issue_from_graphql(node) for node in page["nodes"])
+        if not page["pageInfo"]["hasNextPage"]:
+            return issues
+        variables["after"] = page["pageInfo"]["endCursor"]
 
 @register_action(
     system_type="version_control_system",
@@ -379,6 +1008,7 @@ def list_issues(repo: str, state: Optional[str] = None, labels: Optional[List[st
     arguments=["repo"],
     description="Retrieves information about a specific GitHub repository."
 )
+@_ttl_cache(ttl=30)
 def get_repository_info(repo: str) -> dict:
     """
     Получает информацию о указанном репозитории GitHub.
@@ -389,23 +1019,13 @@ def get_repository_info(repo: str) -> dict:
     Returns:
         dict: Данные о репозитории, включая описание, количество звёзд, форков и статус приватности.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    _check_args(repo)
 
-    # Выполняем запрос для получения информации о репозитории
-    response = requests.get(
-        f"https://api.github.com/repos/Fugaret/{repo}",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        }
-    )
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
-    # Проверяем успешность запроса и возвращаем данные о репозитории
-    response.raise_for_status()
-    return response.json()
+    # Выполняем запрос для получения информации о репозитории
+    return _cached_get(_U_REPO.format_map({"repo": repo}))
 
 @register_action(
     system_type="version_control_system",
@@ -424,22 +1044,20 @@ def star_repository(repo: str) -> dict:
     Returns:
         dict: Сообщение о результате операции.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    _check_args(repo)
+
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
     # Выполняем запрос для добавления звезды к репозиторию
-    response = requests.put(
-        f"https://api.github.com/user/starred/{repo}",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        }
+    response = _do(
+        "PUT",
+        _U_STARRED.format_map({"repo": repo})
     )
 
     # Проверяем успешность запроса и возвращаем сообщение о результате
     if response.status_code == 204:
+        invalidate(get_repository_info, repo)
         return {"message": "Repository starred successfully."}
     else:
         response.raise_for_status()
@@ -461,22 +1079,20 @@ def unstar_repository(repo: str) -> dict:
     Returns:
         dict: Сообщение о результате операции.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    _check_args(repo)
+
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
     # Выполняем запрос для удаления звезды с репозитория
-    response = requests.delete(
-        f"https://api.github.com/user/starred/{repo}",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        }
+    response = _do(
+        "DELETE",
+        _U_STARRED.format_map({"repo": repo})
     )
 
     # Проверяем успешность запроса и возвращаем сообщение о результате
     if response.status_code == 204:
+        invalidate(get_repository_info, repo)
         return {"message": "Repository unstarred successfully."}
     else:
         response.raise_for_status()
@@ -489,6 +1105,7 @@ def unstar_repository(repo: str) -> dict:
     arguments=["repo"],
     description="Retrieves a list of all branches in the specified GitHub repository."
 )
+@_ttl_cache(ttl=30)
 def list_branches(repo: str) -> list:
     """
     Получает список всех веток в указанном репозитории GitHub.
@@ -499,23 +1116,13 @@ def list_branches(repo: str) -> list:
     Returns:
         list: Список веток в репозитории.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    _check_args(repo)
 
-    # Выполняем запрос для получения списка веток
-    response = requests.get(
-        f"https://api.github.com/repos/{repo}/branches",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        }
-    )
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
-    # Проверяем успешность запроса и возвращаем список веток
-    response.raise_for_status()
-    return response.json()
+    # Выполняем запрос для получения списка веток
+    return _cached_get(_U_BRANCHES.format_map({"repo": repo}))
 
 @register_action(
     system_type="version_control_system",
@@ -536,27 +1143,22 @@ def create_branch(repo: str, branch_name: str, commit_sha: str) -> dict:
     Returns:
         dict: Данные о созданной ветке.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    _check_args(repo, branch=branch_name)
+
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
     # Выполняем запрос для создания новой ветки
-    response = requests.post(
-        f"https://api.github.com/repos/{repo}/git/refs",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        },
-        json={
-            "ref": f"refs/heads/{branch_name}",
-            "sha": commit_sha
-        }
+    response = _do(
+        "POST",
+        _U_REFS.format_map({"repo": repo}),
+        json=_compact(ref=f"refs/heads/{branch_name}", sha=commit_sha)
     )
 
     # Проверяем успешность запроса и возвращаем данные о ветке
-    response.raise_for_status()
-    return response.json()
+    data = _finish(response)
+    invalidate(list_branches, repo)
+    return data
 @register_action(
     system_type="version_control_system",
     include_in_plan=True,
@@ -575,29 +1177,25 @@ def delete_branch(repo: str, branch_name: str) -> dict:
     Returns:
         dict: Сообщение о результате операции.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    _check_args(repo, branch=branch_name)
+
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
     # Выполняем запрос для удаления ветки
-    response = requests.delete(
-        f"https://api.github.com/repos/Fugaret/{repo}/git/refs/heads/{branch_name}",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        }
+    response = _do(
+        "DELETE",
+        _U_BRANCH_REF.format_map({"repo": repo, "branch": branch_name})
     )
 
     # Проверяем успешность запроса и возвращаем сообщение о результате
     if response.status_code == 204:
+        invalidate(list_branches, repo)
         return {"message": "Branch deleted successfully."}
     else:
         response.raise_for_status()
         return {"message": "Failed to delete branch."}
 
-import base64
-
 @register_action(
     system_type="version_control_system",
     include_in_plan=True,
@@ -605,6 +1203,7 @@ import base64
     arguments=["repo", "file_path", "branch"],
     description="Retrieves the content of a specified file in the GitHub repository."
 )
+@_ttl_cache(ttl=30)
 def get_file_content(repo: str, file_path: str, branch: str = "main") -> dict:
     """
     Получает содержимое файла в указанном репозитории GitHub по заданному пути.
@@ -617,138 +1216,106 @@ def get_file_content(repo: str, file_path: str, branch: str = "main") -> dict:
     Returns:
         dict: Содержимое файла в виде текста.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
-
-    # Выполняем запрос для получения содержимого файла
-    response = requests.get(
-        f"https://api.github.com/repos/{repo}/contents/{file_path}",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        },
-        params={"ref": branch}
-    )
+    _check_args(repo, branch=branch, file_path=file_path)
 
-    # Проверяем успешность запроса
-    response.raise_for_status()
-    file_data = response.json()
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
-    # Декодируем содержимое файла из base64
-    file_content = base64.b64decode(file_data['content']).decode('utf-8')
+    # Получаем содержимое файла в исходном виде, без обёртки JSON и base64
+    buffer = io.BytesIO()
+    _stream_file(repo, file_path, branch, buffer.write)
 
-    return {"file_content": file_content}
+    return {"file_content": buffer.getvalue().decode('utf-8')}
 
 @register_action(
     system_type="version_control_system",
     include_in_plan=True,
-    signature="(repo: str, file_path: str, content: str, branch: Optional[str] = 'main', message: Optional[str] = 'Create new file') -> dict",
+    signature="(repo: str, file_path: str, content: Union[str, bytes], branch: Optional[str] = 'main', message: Optional[str] = 'Create new file') -> dict",
     arguments=["repo", "file_path", "content", "branch", "message"],
     description="Creates a new file in the specified GitHub repository with the provided content."
 )
-def create_file(repo: str, file_path: str, content: str, branch: str = "main", message: str = "Create new file") -> dict:
+def create_file(repo: str, file_path: str, content: Union[str, bytes], branch: str = "main", message: str = "Create new file") -> dict:
     """
     Создаёт новый файл с указанным содержимым в репозитории GitHub.
 
     Args:
         repo (str): Полное имя репозитория в формате "owner/repo".
         file_path (str): Путь к создаваемому файлу в репозитории.
-        content (str): Содержимое файла в виде строки.
+        content (Union[str, bytes]): Содержимое файла в виде строки или байтов.
         branch (str): Имя ветки, куда будет добавлен файл (по умолчанию 'main').
         message (str): Сообщение коммита для создания файла (по умолчанию 'Create new file').
 
     Returns:
         dict: Данные о созданном файле.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    _check_args(repo, branch=branch, file_path=file_path)
+
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
     # Кодируем содержимое файла в base64
-    encoded_content = base64.b64encode(content.encode('utf-8')).decode('utf-8')
+    encoded_content = _b64encode(content)
 
     # Выполняем запрос для создания файла
-    response = requests.put(
-        f"https://api.github.com/repos/{repo}/contents/{file_path}",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        },
-        json={
-            "message": message,
-            "content": encoded_content,
-            "branch": branch
-        }
+    response = _do(
+        "PUT",
+        _U_CONTENTS.format_map({"repo": repo, "p": file_path}),
+        json=_compact(message=message, content=encoded_content, branch=branch)
     )
 
     # Проверяем успешность запроса и возвращаем данные о созданном файле
-    response.raise_for_status()
-    return response.json()
-import base64
-
+    file_data = _finish(response)
+    invalidate(get_file_content, repo, file_path)
+    _remember_sha(repo, branch, file_path, file_data["content"]["sha"])
+    return file_data
 @register_action(
     system_type="version_control_system",
     include_in_plan=True,
-    signature="(repo: str, file_path: str, content: str, branch: Optional[str] = 'main', message: Optional[str] = 'Update file') -> dict",
+    signature="(repo: str, file_path: str, content: Union[str, bytes], branch: Optional[str] = 'main', message: Optional[str] = 'Update file') -> dict",
     arguments=["repo", "file_path", "content", "branch", "message"],
     description="Updates the content of a specified file in the GitHub repository."
 )
-def update_file(repo: str, file_path: str, content: str, branch: str = "main", message: str = "Update file") -> dict:
+def update_file(repo: str, file_path: str, content: Union[str, bytes], branch: str = "main", message: str = "Update file") -> dict:
     """
     Обновляет содержимое указанного файла в репозитории GitHub.
 
     Args:
         repo (str): Полное имя репозитория в формате "owner/repo".
         file_path (str): Путь к файлу в репозитории.
-        content (str): Новое содержимое файла в виде строки.
+        content (Union[str, bytes]): Новое содержимое файла в виде строки или байтов.
         branch (str): Имя ветки, в которой обновляется файл (по умолчанию 'main').
         message (str): Сообщение коммита для обновления файла (по умолчанию 'Update file').
 
     Returns:
         dict: Данные об обновлённом файле.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    _check_args(repo, branch=branch, file_path=file_path)
 
-    # Получаем текущий SHA файла
-    get_response = requests.get(
-        f"https://api.github.com/repos/{repo}/contents/{file_path}",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        },
-        params={"ref": branch}
-    )
-    get_response.raise_for_status()
-    file_data = get_response.json()
-    file_sha = file_data["sha"]
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
     # Кодируем новое содержимое файла в base64
-    encoded_content = base64.b64encode(content.encode('utf-8')).decode('utf-8')
-
-    # Выполняем запрос для обновления содержимого файла
-    response = requests.put(
-        f"https://api.github.com/repos/{repo}/contents/{file_path}",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        },
-        json={
-            "message": message,
-            "content": encoded_content,
-            "sha": file_sha,
-            "branch": branch
-        }
+    encoded_content = _b64encode(content)
+
+    # Выполняем запрос для обновления содержимого файла, используя известный SHA файла
+    data = _compact(
+        message=message,
+        content=encoded_content,
+        sha=_file_sha(repo, file_path, branch),
+        branch=branch
     )
+    url = _U_CONTENTS.format_map({"repo": repo, "p": file_path})
+    response = _do("PUT", url, json=data)
+    if response.status_code in (409, 422):
+        # Сохранённый SHA устарел: получаем актуальный и повторяем запрос один раз
+        data["sha"] = _file_sha(repo, file_path, branch, refresh=True)
+        response = _do("PUT", url, json=data)
 
     # Проверяем успешность запроса и возвращаем данные об обновлённом файле
-    response.raise_for_status()
-    return response.json()
+    file_data = _finish(response)
+    invalidate(get_file_content, repo, file_path)
+    _remember_sha(repo, branch, file_path, file_data["content"]["sha"])
+    return file_data
 
 
 @register_action(
@@ -771,40 +1338,24 @@ def delete_file(repo: str, file_path: str, branch: str = "main", message: str =
     Returns:
         dict: Данные об удалённом файле.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    _check_args(repo, branch=branch, file_path=file_path)
 
-    # Получаем текущий SHA файла
-    get_response = requests.get(
-        f"https://api.github.com/repos/{repo}/contents/{file_path}",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        },
-        params={"ref": branch}
-    )
-    get_response.raise_for_status()
-    file_data = get_response.json()
-    file_sha = file_data["sha"]
-
-    # Выполняем запрос для удаления файла
-    response = requests.delete(
-        f"https://api.github.com/repos/{repo}/contents/{file_path}",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        },
-        json={
-            "message": message,
-            "sha": file_sha,
-            "branch": branch
-        }
-    )
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
+
+    # Выполняем запрос для удаления файла, используя известный SHA файла
+    data = _compact(message=message, sha=_file_sha(repo, file_path, branch), branch=branch)
+    url = _U_CONTENTS.format_map({"repo": repo, "p": file_path})
+    response = _do("DELETE", url, json=data)
+    if response.status_code in (409, 422):
+        # Сохранённый SHA устарел: получаем актуальный и повторяем запрос один раз
+        data["sha"] = _file_sha(repo, file_path, branch, refresh=True)
+        response = _do("DELETE", url, json=data)
 
     # Проверяем успешность запроса и возвращаем данные об удалении файла
     response.raise_for_status()
+    invalidate(get_file_content, repo, file_path)
+    _forget_sha(repo, branch, file_path)
     return {"message": "File deleted successfully."}
 
 @register_action(
@@ -828,71 +1379,245 @@ def create_pull_request(repo: str, title: str, head: str, base: str, body: str =
     Returns:
         dict: Данные о созданном pull request.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    _check_args(repo)
+
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
     # Выполняем запрос для создания pull request
-    response = requests.post(
-        f"https://api.github.com/repos/{repo}/pulls",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        },
-        json={
-            "title": title,
-            "head": head,
-            "base": base,
-            "body": body
-        }
+    response = _do(
+        "POST",
+        _U_PULLS.format_map({"repo": repo}),
+        # Пустое описание не отправляется вовсе
+        json=_compact(title=title, head=head, base=base, body=body or None)
     )
 
     # Проверяем успешность запроса и возвращаем данные о pull request
-    response.raise_for_status()
-    return response.json()
+    return _finish(response)
+
+
+def _project(item: dict, paths: List[List[str]]) -> dict:
+    # Новый словарь только с указанными полями (путь ['user', 'login'] -> {'user': {'login': ...}});
+    # исходный объект не изменяется, так как он может лежать в кэше
+    projected: dict = {}
+    for path in paths:
+        value: Any = item
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        target = projected
+        for key in path[:-1]:
+            target = target.setdefault(key, {})
+        target[path[-1]] = value
+    return projected
+
+
+# Размер страницы списка pull requests: по умолчанию GitHub отдаёт 30, максимум — 100
+# (в 3 с лишним раза меньше запросов при обходе всего списка)
+_PULLS_PER_PAGE = 30
+_PULLS_MAX_PER_PAGE = 100
+
 
 @register_action(
     system_type="version_control_system",
     include_in_plan=True,
-    signature="(repo: str, state: Optional[str] = 'open') -> list",
-    arguments=["repo", "state"],
-    description="Retrieves a list of pull requests from the specified GitHub repository, with optional filtering by status."
+    signature=(
+        "(repo: str, state: Optional[str] = 'open', page: Optional[int] = 1, "
+        "fields: Optional[List[str]] = None, per_page: Optional[int] = 30) -> list"
+    ),
+    arguments=["repo", "state", "page", "fields", "per_page"],
+    description=(
+        "Retrieves a list of pull requests from the specified GitHub repository, with optional filtering by status. "
+        "Pass fields (e.g. ['number', 'state', 'title', 'user.login']) to get only those fields of each pull request. "
+        "Pass per_page (up to 100) to get more pull requests per page."
+    )
 )
-def list_pull_requests(repo: str, state: str = "open") -> list:
+def list_pull_requests(
+    repo: str,
+    state: str = "open",
+    page: int = 1,
+    fields: Optional[List[str]] = None,
+    per_page: int = _PULLS_PER_PAGE,
+) -> list:
     """
     Получает список pull requests в указанном репозитории GitHub с возможностью фильтрации по статусу.
 
     Args:
         repo (str): Полное имя репозитория в формате "owner/repo".
         state (str): Фильтр по статусу pull requests ('open', 'closed' или 'all').
+        page (int): Номер страницы результатов (по умолчанию 1).
+        fields (Optional[List[str]]): Поля pull request, которые нужно вернуть; вложенные поля
+            указываются через точку, например 'user.login' (по умолчанию — все поля).
+        per_page (int): Число pull requests на странице, от 1 до 100 (по умолчанию 30).
 
     Returns:
         list: Список pull requests, соответствующих указанным фильтрам.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    _check_args(repo, number=page)
+    if not 1 <= per_page <= _PULLS_MAX_PER_PAGE:
+        raise ValueError(f"Invalid per_page: {per_page!r}")
+
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
     # Подготовка параметров запроса
-    params = {
-        "state": state
+    params = _compact(state=state, page=page, per_page=per_page)
+
+    # Условный запрос: при повторном опросе неизменившегося списка GitHub отвечает 304,
+    # который не расходует лимит запросов, и возвращается сохранённый ответ
+    pull_requests = _cached_get(_U_PULLS.format_map({"repo": repo}), params=params)
+    if fields is None:
+        return pull_requests
+
+    # REST API не умеет отдавать часть полей, поэтому лишние поля отбрасываем здесь:
+    # полный pull request весит несколько килобайт, а планировщику обычно нужны 3-4 поля
+    paths = [field.split(".") for field in fields]
+    return [_project(pull_request, paths) for pull_request in pull_requests]
+
+
+# Состояния pull requests, поддерживаемые квалификатором is: поиска GitHub
+_SEARCH_PR_STATES = frozenset({"open", "closed", "merged", "unmerged"})
+
+
+@register_action(
+    system_type="version_control_system",
+    include_in_plan=True,
+    signature="(repo: str, state: Optional[str] = 'merged') -> list",
+    arguments=["repo", "state"],
+    description=(
+        "Finds pull requests in the specified GitHub repository by state ('open', 'closed', 'merged' or 'unmerged') "
+        "with a single search query. Prefer it over checking pull requests one by one to tell merged from unmerged."
+    )
+)
+def search_pull_requests(repo: str, state: str = "merged") -> list:
+    """
+    Ищет pull requests репозитория GitHub по состоянию одним поисковым запросом
+    вместо отдельного запроса на каждый pull request.
+
+    Args:
+        repo (str): Полное имя репозитория в формате "owner/repo".
+        state (str): Состояние pull requests: 'open', 'closed', 'merged' или 'unmerged'.
+
+    Returns:
+        list: Найденные pull requests.
+    """
+    _check_args(repo)
+    if state not in _SEARCH_PR_STATES:
+        raise ValueError(f"Invalid state: {state!r}")
+
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
+
+    # Выполняем поисковый запрос и проходим по страницам из заголовка Link
+    url = _U_SEARCH_ISSUES
+    params = {"q": f"repo:{repo} is:pr is:{state}", "per_page": 100}
+    items = []
+    while url:
+        response = _do("GET", url, params=params)
+        items.extend(_finish(response)["items"])
+        # Ссылка на следующую страницу уже содержит все параметры запроса
+        url, params = response.links.get("next", {}).get("url"), None
+    return items
+
+
+_LIST_PULL_REQUESTS_DETAILED_QUERY = """
+query($owner: String!, $name: String!, $states: [PullRequestState!], $after: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: 100, states: $states, after: $after) {
+      nodes {
+        number
+        title
+        state
+        url
+        headRefName
+        baseRefName
+        mergeable
+        mergeStateStatus
+        reviewRequests(first: 20) {
+          nodes { requestedReviewer { ... on User { login } ... on Team { slug } } }
+        }
+        latestReviews(first: 20) { nodes { author { login } state } }
+      }
+      pageInfo { endCursor hasNextPage }
+    }
+  }
+}
+"""
+
+# В REST закрытые pull requests включают принятые, в GraphQL это отдельное состояние MERGED
+_GRAPHQL_PULL_REQUEST_STATES = {
+    "open": ["OPEN"],
+    "closed": ["CLOSED", "MERGED"],
+    "merged": ["MERGED"],
+    "all": ["OPEN", "CLOSED", "MERGED"],
+}
+
+
+def _pull_request_from_graphql(node: dict) -> dict:
+    # Приводим pull request из GraphQL к плоскому виду с именами полей в стиле REST API
+    return {
+        "number": node["number"],
+        "title": node["title"],
+        "state": node["state"].lower(),
+        "html_url": node["url"],
+        "head": node["headRefName"],
+        "base": node["baseRefName"],
+        "mergeable": node["mergeable"],
+        "merge_state_status": node["mergeStateStatus"],
+        "requested_reviewers": [
+            reviewer.get("login") or reviewer.get("slug")
+            for reviewer in (request["requestedReviewer"] for request in node["reviewRequests"]["nodes"])
+            if reviewer
+        ],
+        "reviews": [
+            {"user": (review["author"] or {}).get("login"), "state": review["state"]}
+            for review in node["latestReviews"]["nodes"]
+        ],
     }
 
-    # Выполняем запрос для получения списка pull requests
-    response = requests.get(
-        f"https://api.github.com/repos/{repo}/pulls",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        },
-        params=params
+
+@register_action(
+    system_type="version_control_system",
+    include_in_plan=True,
+    signature="(repo: str, state: Optional[str] = 'open') -> list",
+    arguments=["repo", "state"],
+    description=(
+        "Retrieves pull requests from the specified GitHub repository together with their mergeability, "
+        "merge state and reviewers. Prefer it over listing pull requests and then inspecting them one by one."
     )
+)
+def list_pull_requests_detailed(repo: str, state: str = "open") -> list:
+    """
+    Получает pull requests репозитория GitHub вместе с возможностью слияния и ревьюерами
+    одним GraphQL-запросом на 100 pull requests вместо запроса на каждый pull request.
+
+    Args:
+        repo (str): Полное имя репозитория в формате "owner/repo".
+        state (str): Фильтр по статусу pull requests ('open', 'closed', 'merged' или 'all').
+
+    Returns:
+        list: Список pull requests с полями mergeable, merge_state_status и ревьюерами.
+    """
+    _check_args(repo)
+    if state not in _GRAPHQL_PULL_REQUEST_STATES:
+        raise ValueError(f"Invalid state: {state!r}")
+
+    owner, name = repo.split("/", 1)
+    variables = {
+        "owner": owner,
+        "name": name,
+        "states": _GRAPHQL_PULL_REQUEST_STATES[state],
+        "after": None,
+    }
+
+    pull_requests = []
+    while True:
+        page = _graphql_repository(_LIST_PULL_REQUESTS_DETAILED_QUERY, variables)["pullRequests"]
+        pull_requests.extend(_pull_request_from_graphql(node) for node in page["nodes"])
+        if not page["pageInfo"]["hasNextPage"]:
+            return pull_requests
+        variables["after"] = page["pageInfo"]["endCursor"]
+
 
-    # Проверяем успешность запроса и возвращаем список pull requests
-    response.raise_for_status()
-    return response.json()
 @register_action(
     system_type="version_control_system",
     include_in_plan=True,
@@ -912,26 +1637,69 @@ def merge_pull_request(repo: str, pull_number: int, commit_message: str = "Mergi
     Returns:
         dict: Данные о выполненном слиянии pull request.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    _check_args(repo, number=pull_number)
+
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
     # Выполняем запрос для принятия pull request
-    response = requests.put(
-        f"https://api.github.com/repos/{repo}/pulls/{pull_number}/merge",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        },
-        json={
-            "commit_message": commit_message
-        }
+    response = _do(
+        "PUT",
+        _U_PULL_MERGE.format_map({"repo": repo, "n": pull_number}),
+        json=_compact(commit_message=commit_message)
     )
 
     # Проверяем успешность запроса и возвращаем данные о слиянии
-    response.raise_for_status()
-    return response.json()
+    return _finish(response)
+
+
+@register_action(
+    system_type="version_control_system",
+    include_in_plan=True,
+    signature="(repo: str, pull_numbers: List[int], commit_message: Optional[str] = 'Merging pull request') -> dict",
+    arguments=["repo", "pull_numbers", "commit_message"],
+    description=(
+        "Merges several pull requests in the GitHub repository at once. "
+        "Prefer it over calling merge_pull_request for each pull request."
+    )
+)
+def bulk_merge_pull_requests(
+    repo: str, pull_numbers: List[int], commit_message: str = "Merging pull request"
+) -> dict:
+    """
+    Принимает (мерджит) несколько pull requests репозитория GitHub параллельно.
+
+    Args:
+        repo (str): Полное имя репозитория в формате "owner/repo".
+        pull_numbers (List[int]): Номера pull requests, которые нужно принять.
+        commit_message (str): Сообщение для коммитов слияния (опционально).
+
+    Returns:
+        dict: Номер pull request -> данные о слиянии или {"error": текст ошибки}.
+    """
+    _check_args(repo)
+    for number in pull_numbers:
+        _check_args(repo, number=number)
+
+    # Импорт здесь: async_actions сам импортирует этот модуль
+    from team_actions.src.actions.GitHub.async_actions import merge_pull_requests_bulk
+
+    # Действия вызываются синхронно: слияния выполняются в собственном event loop,
+    # а если в этом потоке цикл уже запущен — в отдельном потоке
+    coroutine = merge_pull_requests_bulk(repo, pull_numbers, commit_message)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        results = asyncio.run(coroutine)
+    else:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = executor.submit(asyncio.run, coroutine).result()
+    return {
+        number: {"error": str(result)} if isinstance(result, Exception) else result
+        for number, result in results.items()
+    }
+
+
 @register_action(
     system_type="version_control_system",
     include_in_plan=True,
@@ -950,24 +1718,131 @@ def close_pull_request(repo: str, pull_number: int) -> dict:
     Returns:
         dict: Данные о закрытом pull request.
     """
-    # Получаем токен доступа из authorization_data
-    token = authorization_data.get("GitHub", {}).get("access_token")
-    if not token:
-        raise ValueError("Authorization token for GitHub is missing.")
+    _check_args(repo, number=pull_number)
+
+    # Проверяем наличие токена: заголовок Authorization подставляет _do
+    _get_token()
 
 
     # Выполняем запрос для закрытия pull request
-    response = requests.patch(
-        f"https://api.github.com/repos/{repo}/pulls/{pull_number}",
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json"
-        },
+    response = _do(
+        "PATCH",
+        _U_PULL.format_map({"repo": repo, "n": pull_number}),
         json={
             "state": "closed"
         }
     )
 
     # Проверяем успешность запроса и возвращаем данные о закрытии pull request
-    response.raise_for_status()
-    return response.json()
+    return _finish(response)
+
+
+# Запрос и мутации для propose_changes: коммит нескольких файлов и создание pull request
+# выполняются одним GraphQL-документом (мутации внутри документа исполняются по порядку)
+_PROPOSE_CONTEXT_QUERY = """
+query($owner: String!, $name: String!, $head: String!, $base: String!) {
+  repository(owner: $owner, name: $name) {
+    id
+    head: ref(qualifiedName: $head) { target { oid } }
+    base: ref(qualifiedName: $base) { target { oid } }
+  }
+}
+"""
+
+_PROPOSE_MUTATION_TEMPLATE = """
+mutation($repositoryId: ID!, $repo: String!, $branch: String!, $oid: GitObjectID!, $headline: String!,
+         $additions: [FileAddition!], $base: String!, $title: String!, $body: String{ref_variable}) {{
+  {create_ref}
+  createCommitOnBranch(input: {{
+    branch: {{repositoryNameWithOwner: $repo, branchName: $branch}},
+    message: {{headline: $headline}},
+    fileChanges: {{additions: $additions}},
+    expectedHeadOid: $oid
+  }}) {{ commit {{ oid }} }}
+  createPullRequest(input: {{
+    repositoryId: $repositoryId, headRefName: $branch, baseRefName: $base, title: $title, body: $body
+  }}) {{ pullRequest {{ number url }} }}
+}}
+"""
+_PROPOSE_MUTATION = _PROPOSE_MUTATION_TEMPLATE.format(ref_variable="", create_ref="")
+# Вариант для новой ветки: ветка создаётся от base в том же документе
+_PROPOSE_MUTATION_NEW_BRANCH = _PROPOSE_MUTATION_TEMPLATE.format(
+    ref_variable=", $ref: String!",
+    create_ref="createRef(input: {repositoryId: $repositoryId, name: $ref, oid: $oid}) { ref { name } }",
+)
+
+
+@register_action(
+    system_type="version_control_system",
+    include_in_plan=True,
+    signature=(
+        "(repo: str, branch: str, changes: List[List[str]], title: str, "
+        "base: Optional[str] = 'main', body: Optional[str] = '') -> dict"
+    ),
+    arguments=["repo", "branch", "changes", "title", "base", "body"],
+    description="Commits file changes to a branch and opens a pull request into the base branch in one step."
+)
+def propose_changes(
+    repo: str, branch: str, changes: List[List[str]], title: str, base: str = "main", body: str = ""
+) -> dict:
+    """
+    Записывает изменения файлов одним коммитом в ветку и открывает pull request в базовую ветку.
+    Если ветки ещё нет, она создаётся от базовой.
+
+    Args:
+        repo (str): Полное имя репозитория в формате "owner/repo".
+        branch (str): Ветка, в которую записываются изменения.
+        changes (List[List[str]]): Пары [путь к файлу, новое содержимое].
+        title (str): Заголовок коммита и pull request.
+        base (str): Ветка-назначение pull request (по умолчанию 'main').
+        body (str): Описание pull request (опционально).
+
+    Returns:
+        dict: SHA коммита, номер и ссылка на созданный pull request.
+    """
+    _check_args(repo, branch=branch)
+    _check_args(repo, branch=base)
+    for file_path, _ in changes:
+        _check_args(repo, file_path=file_path)
+
+    # Один запрос: идентификатор репозитория и текущие коммиты обеих веток
+    owner, name = repo.split("/", 1)
+    repository = _graphql(
+        _PROPOSE_CONTEXT_QUERY,
+        {"owner": owner, "name": name, "head": f"refs/heads/{branch}", "base": f"refs/heads/{base}"},
+        allow_partial=False,
+    )["repository"]
+    if repository["base"] is None:
+        raise ValueError(f"Base branch {base!r} not found in {repo!r}.")
+
+    variables = {
+        "repositoryId": repository["id"],
+        "repo": repo,
+        "branch": branch,
+        "headline": title,
+        "additions": [
+            {"path": file_path, "contents": _b64encode(content)} for file_path, content in changes
+        ],
+        "base": base,
+        "title": title,
+        "body": body or None,
+    }
+    if repository["head"] is None:
+        variables["oid"] = repository["base"]["target"]["oid"]
+        variables["ref"] = f"refs/heads/{branch}"
+        data = _graphql(_PROPOSE_MUTATION_NEW_BRANCH, variables, allow_partial=False, retry=False)
+        invalidate(list_branches, repo)
+    else:
+        variables["oid"] = repository["head"]["target"]["oid"]
+        data = _graphql(_PROPOSE_MUTATION, variables, allow_partial=False, retry=False)
+
+    for file_path, _ in changes:
+        invalidate(get_file_content, repo, file_path)
+        _forget_sha(repo, branch, file_path)
+
+    pull_request = data["createPullRequest"]["pullRequest"]
+    return {
+        "commit_sha": data["createCommitOnBranch"]["commit"]["oid"],
+        "pull_request_number": pull_request["number"],
+        "pull_request_url": pull_request["url"],
+    }
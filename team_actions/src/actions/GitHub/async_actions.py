@@ -0,0 +1,317 @@
+import asyncio
+import binascii
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import aiohttp
+import httpx
+from requests.utils import parse_header_links
+
+from team_actions.src.actions.GitHub import actions as github_actions
+from team_actions.src.actions.GitHub.client import new_client
+
+# Асинхронные варианты действий GitHub для массовых операций.
+# Синхронные действия из actions.py остаются без изменений, а здесь N запросов
+# выполняются параллельно, поэтому время ответа ≈ ⌈N/K⌉·RTT вместо N·RTT.
+
+# Ограничение числа одновременных запросов, чтобы не упираться во вторичные лимиты GitHub
+MAX_CONCURRENT_REQUESTS = 10
+
+# Общий предел одновременных запросов через клиент из client.py (на хост api.github.com).
+# Семафор привязан к event loop, поэтому создаётся заново при смене цикла.
+MAX_HOST_CONNECTIONS = 64
+_host_semaphore: Optional[asyncio.Semaphore] = None
+_host_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _concurrency_from_remaining() -> int:
+    # Чем меньше остаток лимита основного токена, тем меньше параллельных запросов
+    token = github_actions._get_token()
+    with github_actions._TOKEN_LOCK:
+        remaining = github_actions._token_state(token, "core")["remaining"]
+    return max(1, min(MAX_CONCURRENT_REQUESTS, int(remaining) // 100))
+
+
+def _client_session() -> Any:
+    # Получаем токен доступа из authorization_data
+    token = github_actions._get_token()
+
+    if github_actions.USE_HTTPX:
+        # Все запросы пакета идут параллельными потоками HTTP/2 в одном соединении.
+        # Клиент создаётся на вызов, чтобы пул соединений не был привязан к чужому event loop.
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+            headers=github_actions._auth_headers(token),
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            follow_redirects=True,
+        )
+
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+        headers=github_actions._auth_headers(token),
+    )
+
+
+async def _afetch(session: Any, method: str, url: str, **kwargs: Any) -> Tuple[Any, Mapping[str, str]]:
+    # Возвращает разобранное тело ответа и его заголовки
+    if not isinstance(session, aiohttp.ClientSession):
+        # httpx.AsyncClient
+        response = await session.request(method, url, **kwargs)
+        github_actions._update_token_state(github_actions._get_token(), "core", response)
+        response.raise_for_status()
+        return github_actions._loads(response.content), response.headers
+
+    async with session.request(method, url, **kwargs) as response:
+        github_actions._update_token_state(github_actions._get_token(), "core", response)
+        response.raise_for_status()
+        return github_actions._loads(await response.read()), response.headers
+
+
+async def _agh(
+    session: Any, semaphore: asyncio.Semaphore, method: str, url: str, **kwargs: Any
+) -> Any:
+    async with semaphore:
+        data, _ = await _afetch(session, method, url, **kwargs)
+        return data
+
+
+def _last_page(link_header: Optional[str]) -> int:
+    # Номер последней страницы из заголовка Link (rel="last"); без него страница одна
+    if not link_header:
+        return 1
+    for link in parse_header_links(link_header):
+        if link.get("rel") == "last":
+            return int(parse_qs(urlsplit(link["url"]).query)["page"][0])
+    return 1
+
+
+async def get_issues_bulk(repo: str, numbers: List[int]) -> List[dict]:
+    """
+    Получает несколько задач (issues) из репозитория GitHub параллельно.
+
+    Args:
+        repo (str): Полное имя репозитория в формате "owner/repo".
+        numbers (List[int]): Номера задач в репозитории.
+
+    Returns:
+        List[dict]: Данные о задачах в порядке переданных номеров.
+    """
+    github_actions._check_args(repo)
+    for number in numbers:
+        github_actions._check_args(repo, number=number)
+
+    async with _client_session() as session:
+        semaphore = asyncio.Semaphore(_concurrency_from_remaining())
+        return await asyncio.gather(
+            *(
+                _agh(session, semaphore, "GET", github_actions._U_ISSUE.format_map({"repo": repo, "n": number}))
+                for number in numbers
+            )
+        )
+
+
+async def get_files_bulk(repo: str, paths: List[str], branch: str = "main") -> List[dict]:
+    """
+    Получает содержимое нескольких файлов из репозитория GitHub параллельно.
+
+    Args:
+        repo (str): Полное имя репозитория в формате "owner/repo".
+        paths (List[str]): Пути к файлам в репозитории.
+        branch (str): Имя ветки, откуда извлекаются файлы (по умолчанию 'main').
+
+    Returns:
+        List[dict]: Содержимое файлов в виде текста в порядке переданных путей.
+    """
+    github_actions._check_args(repo, branch=branch)
+    for path in paths:
+        github_actions._check_args(repo, file_path=path)
+
+    async with _client_session() as session:
+        semaphore = asyncio.Semaphore(_concurrency_from_remaining())
+        files_data = await asyncio.gather(
+            *(
+                _agh(
+                    session,
+                    semaphore,
+                    "GET",
+                    github_actions._U_CONTENTS.format_map({"repo": repo, "p": path}),
+                    params={"ref": branch},
+                )
+                for path in paths
+            )
+        )
+
+    return [
+        {"file_content": binascii.a2b_base64(file_data["content"]).decode("utf-8")}
+        for file_data in files_data
+    ]
+
+
+async def list_issues_all(
+    repo: str,
+    state: Optional[str] = None,
+    labels: Optional[List[str]] = None,
+    assignee: Optional[str] = None,
+    per_page: int = 100,
+) -> List[dict]:
+    """
+    Получает все задачи (issues) репозитория GitHub: первая страница определяет число страниц,
+    остальные запрашиваются параллельно.
+
+    Args:
+        repo (str): Полное имя репозитория в формате "owner/repo".
+        state (Optional[str]): Состояние задач ('open', 'closed', 'all'; по умолчанию 'open').
+        labels (Optional[List[str]]): Список меток для фильтрации задач (опционально).
+        assignee (Optional[str]): Логин пользователя, назначенного на задачи (опционально).
+        per_page (int): Число задач на странице (максимум 100).
+
+    Returns:
+        List[dict]: Список всех задач в порядке страниц.
+    """
+    github_actions._check_args(repo)
+
+    url = github_actions._U_ISSUES.format_map({"repo": repo})
+    params = github_actions._compact(
+        state=state or "open",
+        labels=",".join(labels) if labels else None,
+        assignee=assignee,
+        per_page=per_page,
+    )
+
+    return await _fetch_all_pages(url, params)
+
+
+async def list_pull_requests_all(repo: str, state: str = "open", per_page: int = 100) -> List[dict]:
+    """
+    Получает все pull requests репозитория GitHub: первая страница определяет число страниц,
+    остальные запрашиваются параллельно.
+
+    Args:
+        repo (str): Полное имя репозитория в формате "owner/repo".
+        state (str): Фильтр по статусу pull requests ('open', 'closed' или 'all').
+        per_page (int): Число pull requests на странице (максимум 100).
+
+    Returns:
+        List[dict]: Список всех pull requests в порядке страниц.
+    """
+    github_actions._check_args(repo)
+
+    url = github_actions._U_PULLS.format_map({"repo": repo})
+    return await _fetch_all_pages(url, github_actions._compact(state=state, per_page=per_page))
+
+
+async def _fetch_all_pages(url: str, params: dict) -> List[dict]:
+    # Первая страница возвращает в заголовке Link ссылку rel="last", по ней запрашиваются
+    # страницы 2..last одновременно вместо последовательного перехода по rel="next"
+    async with _client_session() as session:
+        items, headers = await _afetch(session, "GET", url, params=params)
+        last_page = _last_page(headers.get("Link"))
+        semaphore = asyncio.Semaphore(_concurrency_from_remaining())
+        pages = await asyncio.gather(
+            *(
+                _agh(session, semaphore, "GET", url, params={**params, "page": page})
+                for page in range(2, last_page + 1)
+            )
+        )
+
+    for page in pages:
+        items.extend(page)
+    return items
+
+
+def _get_host_semaphore() -> asyncio.Semaphore:
+    global _host_semaphore, _host_semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _host_semaphore is None or _host_semaphore_loop is not loop:
+        _host_semaphore = asyncio.Semaphore(MAX_HOST_CONNECTIONS)
+        _host_semaphore_loop = loop
+    return _host_semaphore
+
+
+async def _rl_request(
+    client: httpx.AsyncClient, method: str, url: str, json: Optional[dict] = None, **kwargs: Any
+) -> Any:
+    # Запрос через HTTP/2-клиент из client.py с учётом лимитов GitHub: состояние лимитов
+    # общее с синхронными действиями, а ожидание сброса и повторы 403/429 не блокируют event loop
+    bucket = github_actions._rate_limit_bucket(url)
+    extra_headers = {}
+    if json is not None:
+        extra_headers["Content-Type"] = "application/json"
+        kwargs["content"] = github_actions._dumps(json)
+
+    delay = github_actions._BACKOFF_BASE
+    for _ in range(github_actions._RATE_LIMIT_ATTEMPTS):
+        token, wait = github_actions._choose_token(bucket)
+        while wait:
+            # Все токены исчерпаны: ждём сброса лимита
+            await asyncio.sleep(wait)
+            token, wait = github_actions._choose_token(bucket)
+
+        headers = github_actions._auth_headers(token)
+        if extra_headers:
+            headers = {**headers, **extra_headers}
+        async with _get_host_semaphore():
+            response = await client.request(method, url, headers=headers, **kwargs)
+        github_actions._update_token_state(token, bucket, response)
+
+        wait = github_actions._retry_delay(response, delay)
+        if wait is None and method in github_actions._IDEMPOTENT_METHODS:
+            # Клиент не повторяет ответы 5xx сам; POST не повторяем, чтобы не создать дубликат
+            wait = github_actions._server_error_delay(response, delay)
+        if wait is None:
+            break
+        if wait:
+            await asyncio.sleep(wait)
+            delay = min(delay * 2, github_actions._BACKOFF_MAX)
+
+    return github_actions._finish(response)
+
+
+async def _merge_pull_request(client: httpx.AsyncClient, repo: str, pull_number: int, commit_message: str) -> dict:
+    return await _rl_request(
+        client,
+        "PUT",
+        github_actions._U_PULL_MERGE.format_map({"repo": repo, "n": pull_number}),
+        json=github_actions._compact(commit_message=commit_message),
+    )
+
+
+async def merge_pull_requests_bulk(
+    repo: str, pull_numbers: List[int], commit_message: str = "Merging pull request"
+) -> Dict[int, Any]:
+    """
+    Принимает (merge) несколько pull requests репозитория GitHub параллельно.
+    Ошибка одного слияния не прерывает остальные.
+
+    Args:
+        repo (str): Полное имя репозитория в формате "owner/repo".
+        pull_numbers (List[int]): Номера pull requests.
+        commit_message (str): Сообщение коммита для слияния.
+
+    Returns:
+        Dict[int, Any]: Номер pull request -> данные о слиянии или возникшее исключение.
+    """
+    github_actions._check_args(repo)
+    for number in pull_numbers:
+        github_actions._check_args(repo, number=number)
+
+    # Клиент живёт ровно столько, сколько пакет слияний: вызывающий код запускает пакет
+    # в собственном event loop, и соединения не должны пережить этот цикл
+    async with new_client() as client:
+        results = await asyncio.gather(
+            *(_merge_pull_request(client, repo, number, commit_message) for number in pull_numbers),
+            return_exceptions=True,
+        )
+        merged = dict(zip(pull_numbers, results))
+
+        # Параллельные слияния в одну ветку могут получить 405/409 "Base branch was modified":
+        # такие pull requests повторяем по одному, когда остальные слияния уже завершились
+        for number, result in merged.items():
+            if isinstance(result, httpx.HTTPStatusError) and result.response.status_code in (405, 409):
+                try:
+                    merged[number] = await _merge_pull_request(client, repo, number, commit_message)
+                except Exception as e:
+                    merged[number] = e
+    return merged
+
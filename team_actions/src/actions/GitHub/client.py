@@ -0,0 +1,26 @@
+import httpx
+
+# Асинхронный HTTP/2-клиент для асинхронных действий GitHub: параллельные запросы
+# мультиплексируются в общих соединениях вместо отдельного TCP+TLS рукопожатия на каждый вызов.
+# Пул соединений привязан к event loop, поэтому клиент создаётся на время операции
+# и закрывается вместе с ней (async with), а не хранится между вызовами.
+
+
+def new_client() -> httpx.AsyncClient:
+    """
+    Создаёт httpx.AsyncClient для запросов к GitHub API.
+
+    Returns:
+        httpx.AsyncClient: Клиент с HTTP/2 и пулом keep-alive соединений.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        timeout=10.0,
+        follow_redirects=True,
+        headers={
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "team_actions/1.0",
+            "X-GitHub-Api-Version": "2022-11-28",
+        },
+    )
@@ -1,17 +1,19 @@
 import os
 import re
 import requests
+from pathlib import Path
 from typing import Dict
 import importlib.util
 import shutil
 import zipfile
 
-from team_actions.src.settings import settings
+from team_actions.src.settings import get_settings
 from team_actions.src.systems_config import systems_info, available_actions
 
 
 def collect_systems_documentation() -> Dict[str, str]:
-    actions_directory: str = os.path.join(settings.root_directory, "actions")
+    settings = get_settings()
+    actions_directory: Path = settings.root_directory / "actions"
     systems_documentation: Dict[str, str] = {}
     uppercase_dir_pattern = re.compile(r"^[A-Z]")
 
@@ -53,7 +55,7 @@ def collect_systems_documentation() -> Dict[str, str]:
 
 
 def check_user_settings() -> None:
-    assert settings.team_id != "", "Укажите ID команды в settings.py"
+    assert get_settings().team_id != "", "Укажите ID команды в settings.py"
 
 
 def create_zip_archive():
@@ -75,6 +77,7 @@ def upload_zip(zip_file_path: str):
                     files["requirements.txt"] = req_file.read()
 
         files["code_zip"] = open(zip_file_path, "rb")
+        settings = get_settings()
         response = requests.post(
             url=f"{settings.backend_api}/upload-actions-code",
             files=files,
@@ -1,18 +1,20 @@
+import hashlib
+import json
 import os
+import time
 import requests
 from functools import wraps
 from typing import Any, Callable, Optional, Dict, List
 
-from team_actions.src.settings import settings
+from team_actions.src.settings import get_settings
 from team_actions.src.utils.exceptions import TeamHackathonException
-from team_actions.src.utils.action_router import ActionRouter
 
 
 def fetch_available_actions() -> Dict[str, Any]:
     """Fetches systems configuration data from a specified endpoint."""
     try:
         response = requests.get(
-            f"{settings.backend_api}/actions/base-available-actions"
+            f"{get_settings().backend_api}/actions/base-available-actions"
         )
         response.raise_for_status()  # Raises an error for HTTP codes 4xx/5xx
         return response.json()
@@ -20,6 +22,61 @@ def fetch_available_actions() -> Dict[str, Any]:
         print(f"Error fetching systems configuration: {e}")
 
 
+_AVAILABLE_ACTIONS_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "team_actions"
+)
+
+
+def _available_actions_cache_path() -> str:
+    """Builds the cache file path from the backend URL the actions are fetched from."""
+    digest = hashlib.sha1(get_settings().backend_api.encode("utf-8")).hexdigest()
+    return os.path.join(_AVAILABLE_ACTIONS_CACHE_DIR, f"actions-{digest}.json")
+
+
+def _read_available_actions_cache(cache_path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(cache_path, "rb") as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+
+def load_available_actions() -> Dict[str, Any]:
+    """
+    Returns the base available actions, reading them from the on-disk cache when possible.
+    The cached copy is used for settings.available_actions_cache_ttl seconds after it was fetched
+    (0 disables the cache); after that the data is refetched from the backend.
+    To force a refetch, delete ~/.cache/team_actions (or $XDG_CACHE_HOME/team_actions).
+    """
+    cache_path = _available_actions_cache_path()
+    ttl = get_settings().available_actions_cache_ttl
+    cached = None
+    if ttl > 0:
+        cached = _read_available_actions_cache(cache_path)
+        try:
+            is_fresh = time.time() - os.path.getmtime(cache_path) < ttl
+        except OSError:
+            is_fresh = False
+        if cached is not None and is_fresh:
+            return cached
+
+    available_actions = fetch_available_actions()
+    if available_actions is None:
+        # Backend is unreachable: an expired copy is still better than no actions at all
+        return cached
+    if ttl > 0:
+        try:
+            os.makedirs(_AVAILABLE_ACTIONS_CACHE_DIR, exist_ok=True)
+            # Write to a temporary file first so concurrent workers never read a partial file
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as cache_file:
+                json.dump(available_actions, cache_file)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Error caching available actions: {e}")
+    return available_actions
+
+
 def infer_system_name(func: Callable[..., Any]) -> str:
     """Infer system_name from the function's file location."""
     # Get the full path of the module where the function is defined
@@ -46,7 +103,11 @@ def register_action(
 
     def decorator(func: Callable[..., Any]):
 
-        from team_actions.src.systems_config import available_actions, systems_info
+        from team_actions.src.systems_config import (
+            available_actions,
+            system_category_of,
+            systems_info,
+        )
 
         system_name: str = infer_system_name(func)
 
@@ -56,11 +117,12 @@ def register_action(
             raise Exception(
                 f"Seems function '{func}' doesn't have a name, so can't be registered"
             )
-        try:
+        # The reverse index also catches a system registered under the wrong system_type
+        if system_category_of(system_name) == system_type:
             system_specific_description: str = systems_info[system_type]["systems"][
                 system_name
             ]
-        except KeyError:
+        else:
             print(f"System {system_name} not found in systems_info")
             system_specific_description: str = ""
 
@@ -104,9 +166,8 @@ def register_action(
                     f"Error in action for system '{system_name}' with action '{action_name}'"
                 ) from e
 
-        ActionRouter.register_new_action_function(
-            system_name=system_name, function_name=action_name, action_func=wrapper
-        )
+        # The router picks the action up by this attribute in ActionRouter.add_actions_for_module
+        wrapper._action_meta = {"system_name": system_name, "function_name": action_name}
         return wrapper
 
     return decorator
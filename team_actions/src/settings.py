@@ -1,4 +1,5 @@
-import os
+from functools import lru_cache
+from pathlib import Path
 
 from pydantic_settings import BaseSettings
 
@@ -6,7 +7,15 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     team_id: str = "c44cd9dd-4929-4fb1-82c0-f93a26c8e937"
     backend_api: str = "https://aes-agniachallenge-case.olymp.innopolis.university/"
-    root_directory: str = os.path.dirname(__file__)
+    root_directory: Path = Path(__file__).resolve().parent
+    # Сколько секунд использовать сохранённый на диске список базовых действий бэкенда (0 — не кэшировать)
+    available_actions_cache_ttl: float = 3600
+    # Транспорт действий GitHub: httpx с HTTP/2 или requests.
+    # Задаётся и переменной окружения GITHUB_USE_HTTPX=false
+    github_use_httpx: bool = True
 
 
-settings = Settings()
+# Настройки создаются при первом обращении, а не при импорте модуля
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
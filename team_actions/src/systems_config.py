@@ -1,5 +1,5 @@
-from typing import Dict, Any
-from team_actions.src.registration import fetch_available_actions
+from typing import Dict, Any, Optional
+from team_actions.src.registration import load_available_actions
 
 # Основной словарь с конфигурацией и описанием доступных систем
 systems_info: Dict[str, Any] = {
@@ -35,5 +35,24 @@ systems_info: Dict[str, Any] = {
     },
 }
 
+# Обратный индекс: имя системы -> категория, строится один раз при импорте
+_system_to_category: Dict[str, str] = {
+    name: category for category, info in systems_info.items() for name in info["systems"]
+}
+
+
+def system_category_of(name: str) -> Optional[str]:
+    """
+    Возвращает категорию, к которой относится система.
+
+    Args:
+        name (str): Имя системы, например "GitHub".
+
+    Returns:
+        Optional[str]: Категория системы (например "version_control_system") или None, если система неизвестна.
+    """
+    return _system_to_category.get(name)
+
+
 # Список доступных действий, получаемых из системы регистрации
-available_actions: Dict[str, Any] = fetch_available_actions()
+available_actions: Dict[str, Any] = load_available_actions()
@@ -16,12 +16,26 @@ class ActionRouter:
     @classmethod
     def add_actions_for_module(cls, action_module: ModuleType) -> None:
         """
-        Needed so the action functions from action module are added to router.
-        Actual logic happens in @register_action decorator, added to action functions.
-        Without adding action module to ActionRouter using this method, action module is never imported,
-        so decorators for action functions are not called, and action functions are not registered in ActionRouter
+        Adds the action functions from action module to router.
+        @register_action marks each action function with an `_action_meta` attribute,
+        so a single pass over the module namespace finds all of them.
         """
-        pass
+        for action_func in vars(action_module).values():
+            action_meta = getattr(action_func, "_action_meta", None)
+            if action_meta is not None:
+                cls.register_new_action_function(
+                    system_name=action_meta["system_name"],
+                    function_name=action_meta["function_name"],
+                    action_func=action_func,
+                )
+
+    @classmethod
+    def register_modules(cls, *action_modules: ModuleType) -> None:
+        """
+        Adds several action modules to the router in one call.
+        """
+        for action_module in action_modules:
+            cls.add_actions_for_module(action_module)
 
     def get_action_functions_by_system_name(
         self, system_name: str
@@ -0,0 +1,33 @@
+import importlib
+import sys
+import types
+
+import pytest
+
+_SYSTEMS_CONFIG = "team_actions.src.systems_config"
+_GITHUB_MODULES = (
+    "team_actions.src.actions.GitHub.actions",
+    "team_actions.src.actions.GitHub.async_actions",
+)
+
+
+@pytest.fixture
+def github_actions(monkeypatch):
+    """
+    Импортирует действия GitHub с заглушкой systems_config: настоящий модуль при импорте
+    запрашивает список действий у бэкенда. Заглушка и импортированные с ней модули
+    убираются из sys.modules после теста.
+    """
+    systems_config = types.ModuleType(_SYSTEMS_CONFIG)
+    systems_config.available_actions = {}
+    systems_config.systems_info = {}
+    systems_config.system_category_of = lambda name: None
+    monkeypatch.setitem(sys.modules, _SYSTEMS_CONFIG, systems_config)
+    for name in _GITHUB_MODULES:
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    module = importlib.import_module(_GITHUB_MODULES[0])
+    yield module
+
+    for name in _GITHUB_MODULES:
+        sys.modules.pop(name, None)
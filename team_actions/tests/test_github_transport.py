@@ -0,0 +1,226 @@
+import asyncio
+
+import httpx
+import pytest
+
+from team_actions.src.utils.exceptions import TeamHackathonException
+
+
+@pytest.fixture
+def mock_client(monkeypatch, github_actions):
+    """Подменяет транспорт клиента httpx по умолчанию на MockTransport с заданным обработчиком."""
+
+    def install(handler):
+        client = httpx.Client(
+            transport=httpx.MockTransport(handler),
+            headers=github_actions._CLIENT.headers,
+            follow_redirects=github_actions._CLIENT.follow_redirects,
+        )
+        monkeypatch.setattr(github_actions, "_CLIENT", client)
+        monkeypatch.setattr(github_actions, "USE_HTTPX", True)
+        monkeypatch.setitem(github_actions.authorization_data, "GitHub", {"access_token": "test-token"})
+        return client
+
+    return install
+
+
+def test_default_transport_is_httpx(github_actions):
+    assert github_actions.USE_HTTPX
+    assert github_actions._CLIENT is not None
+
+
+def test_renamed_repository_redirect_is_followed(mock_client, github_actions):
+    def handler(request):
+        if request.url.path == "/repos/o/old":
+            return httpx.Response(301, headers={"Location": "https://api.github.com/repositories/42"})
+        assert request.headers["Authorization"] == "Bearer test-token"
+        return httpx.Response(200, json={"full_name": "o/new"})
+
+    mock_client(handler)
+
+    assert github_actions.get_repository_info(repo="o/old") == {"full_name": "o/new"}
+
+
+def test_post_is_not_retried_after_server_error(mock_client, monkeypatch, github_actions):
+    monkeypatch.setattr(github_actions.time, "sleep", lambda seconds: None)
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(502)
+
+    mock_client(handler)
+
+    with pytest.raises(Exception):
+        github_actions.create_issue(repo="o/r", title="t")
+    assert calls == ["POST"]
+
+
+def test_graphql_query_is_retried_after_server_error(mock_client, monkeypatch, github_actions):
+    monkeypatch.setattr(github_actions.time, "sleep", lambda seconds: None)
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        if len(calls) == 1:
+            return httpx.Response(502)
+        return httpx.Response(200, json={"data": {"viewer": {"login": "me"}}})
+
+    mock_client(handler)
+
+    assert github_actions._graphql("query { viewer { login } }", {}) == {"viewer": {"login": "me"}}
+    assert calls == ["POST", "POST"]
+
+
+def test_authorization_is_sent_per_request(mock_client, monkeypatch, github_actions):
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200, json={"full_name": "o/r"})
+
+    client = mock_client(handler)
+    monkeypatch.setitem(github_actions.authorization_data, "GitHub", {"access_tokens": ["first", "second"]})
+    github_actions._refresh_auth()
+
+    github_actions.get_repository_info(repo="o/r")
+
+    assert seen == ["Bearer first"]
+    assert "Authorization" not in client.headers
+    assert "Authorization" not in github_actions._SESSION.headers
+
+
+def test_http_date_retry_after_falls_back_to_backoff(mock_client, monkeypatch, github_actions):
+    sleeps = []
+    monkeypatch.setattr(github_actions.time, "sleep", sleeps.append)
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"})
+        return httpx.Response(200, json={"full_name": "o/r"})
+
+    mock_client(handler)
+
+    assert github_actions.get_repository_info(repo="o/r") == {"full_name": "o/r"}
+    assert len(calls) == 2
+    assert github_actions._BACKOFF_BASE <= sleeps[0] <= 2 * github_actions._BACKOFF_BASE
+
+
+def test_last_streamed_response_is_returned_open(mock_client, monkeypatch, github_actions):
+    monkeypatch.setattr(github_actions.time, "sleep", lambda seconds: None)
+
+    def handler(request):
+        return httpx.Response(503, content=iter([b"unavailable"]))
+
+    mock_client(handler)
+
+    response = github_actions._do("GET", "https://api.github.com/repos/o/r", stream=True)
+    assert response.status_code == 503
+    assert not response.is_closed
+    assert response.read() == b"unavailable"
+
+
+def test_list_pull_requests_keeps_default_page_size(mock_client, github_actions):
+    seen = []
+
+    def handler(request):
+        seen.append(dict(request.url.params))
+        return httpx.Response(200, json=[])
+
+    mock_client(handler)
+
+    github_actions.list_pull_requests(repo="o/r", page=2)
+    github_actions.list_pull_requests(repo="o/r", page=2, per_page=100)
+
+    assert seen[0]["per_page"] == "30"
+    assert seen[1]["per_page"] == "100"
+    with pytest.raises(TeamHackathonException):
+        github_actions.list_pull_requests(repo="o/r", per_page=101)
+
+
+def test_update_after_create_reuses_the_known_sha(mock_client, github_actions):
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(201, json={"content": {"sha": "a" * 40}})
+
+    mock_client(handler)
+
+    github_actions.create_file(repo="o/r", file_path="f.txt", content="one")
+    github_actions.update_file(repo="o/r", file_path="f.txt", content="two")
+
+    assert calls == ["PUT", "PUT"]
+
+
+def test_known_shas_are_bounded(monkeypatch, github_actions):
+    monkeypatch.setattr(github_actions, "_FILE_SHA", github_actions.OrderedDict())
+    monkeypatch.setattr(github_actions, "_FILE_SHA_MAXSIZE", 2)
+
+    for name in ("a", "b", "c"):
+        github_actions._remember_sha("o/r", "main", name, name * 40)
+
+    assert list(github_actions._FILE_SHA) == [("o/r", "main", "b"), ("o/r", "main", "c")]
+
+
+def test_bulk_merge_closes_its_client(monkeypatch, github_actions):
+    from team_actions.src.actions.GitHub import async_actions
+
+    clients = []
+
+    def handler(request):
+        return httpx.Response(200, json={"merged": True})
+
+    def new_client():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(async_actions, "new_client", new_client)
+    monkeypatch.setitem(github_actions.authorization_data, "GitHub", {"access_token": "test-token"})
+
+    result = github_actions.bulk_merge_pull_requests(repo="o/r", pull_numbers=[1, 2])
+
+    assert result == {1: {"merged": True}, 2: {"merged": True}}
+    assert [client.is_closed for client in clients] == [True]
+
+
+def test_cached_reads_return_independent_copies(mock_client, github_actions):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"number": 1, "labels": []})
+
+    mock_client(handler)
+
+    first = github_actions.get_issue(repo="o/r", issue_number=1)
+    first["labels"].append("changed")
+    second = github_actions.get_issue(repo="o/r", issue_number=1)
+    github_actions.invalidate(github_actions.get_issue, "o/r", 1)
+    github_actions.get_issue(repo="o/r", issue_number=1)
+
+    assert second == {"number": 1, "labels": []}
+    assert calls == ["/repos/o/r/issues/1", "/repos/o/r/issues/1"]
+
+
+def test_malformed_arguments_are_rejected_before_any_request(mock_client, github_actions):
+    from team_actions.src.actions.GitHub import async_actions
+
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={})
+
+    mock_client(handler)
+
+    with pytest.raises(TeamHackathonException):
+        github_actions.get_issue(repo="not a repo", issue_number=1)
+    with pytest.raises(TeamHackathonException):
+        github_actions.get_file_content(repo="o/r", file_path="../secret")
+    with pytest.raises(ValueError):
+        asyncio.run(async_actions.get_issues_bulk("o/r", [1, 0]))
+    assert calls == []